@@ -327,17 +327,26 @@ def build(
 @app.command()
 def resolve(
     model: str = typer.Option(None, help="LLM model for entity resolution"),
+    small_model: str | None = typer.Option(
+        None, "--small-model", help="Cheaper LLM for small resolve batches (e.g. openai/gpt-4o-mini); shares the --rpm limit with --model"
+    ),
     domain: str | None = typer.Option(None, help="Path to custom domain YAML"),
     domain_name: str = typer.Option(
         "schema-free", "--domain-name", "-d", help="Bundled domain name (e.g. general, osint)"
     ),
     concurrency: int = typer.Option(4, "-c", "--concurrency", help="Concurrent LLM calls"),
     rpm: int = typer.Option(40, "--rpm", help="Max requests per minute"),
+    tpm: int = typer.Option(
+        0, "--tpm", help="Max tokens per minute for resolve batches (0 = unlimited)"
+    ),
     use_embeddings: bool = typer.Option(
         False,
         "--embeddings",
         help="Use semantic clustering (requires: pip install sift-kg[embeddings])",
     ),
+    force: bool = typer.Option(
+        False, "--force", "-f", help="Re-query the LLM, ignoring cached resolve responses"
+    ),
     output: str | None = typer.Option(None, "-o", help="Output directory"),
     verbose: bool = typer.Option(False, "-v", "--verbose", help="Verbose logging"),
 ) -> None:
@@ -349,6 +358,8 @@ def resolve(
 
     try:
         config.validate_api_keys(effective_model)
+        if small_model:
+            config.validate_api_keys(small_model)
     except ValueError as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1) from None
@@ -366,6 +377,7 @@ def resolve(
 
     from sift_kg.extract.llm_client import LLMClient
     from sift_kg.graph.knowledge_graph import KnowledgeGraph
+    from sift_kg.resolve.cache import ResolveCache
     from sift_kg.resolve.io import read_relation_review, write_proposals, write_relation_review
     from sift_kg.resolve.models import RelationReviewFile
     from sift_kg.resolve.resolver import find_merge_candidates
@@ -374,13 +386,17 @@ def resolve(
     console.print(f"[cyan]Domain:[/cyan] {domain_config.name}")
     console.print(f"[cyan]Graph:[/cyan] {kg.entity_count} entities, {kg.relation_count} relations")
 
-    llm = LLMClient(model=effective_model, rpm=rpm)
+    llm = LLMClient(model=effective_model, rpm=rpm, json_mode=True)
+    small_llm = llm.with_model(small_model) if small_model else None
     merge_file, variant_relations = find_merge_candidates(
         kg,
         llm,
         concurrency=concurrency,
         use_embeddings=use_embeddings,
         system_context=system_context,
+        tpm=tpm,
+        cache=ResolveCache(output_dir / "resolve_cache.json", effective_model, fresh=force),
+        small_llm=small_llm,
     )
 
     if not merge_file.proposals and not variant_relations:
@@ -415,7 +431,8 @@ def resolve(
         console.print(
             f"[green]Found {len(variant_relations)} variant relationships (EXTENDS)[/green]"
         )
-    console.print(f"  Cost: ${llm.total_cost_usd:.4f}")
+    cost = llm.total_cost_usd + (small_llm.total_cost_usd if small_llm else 0.0)
+    console.print(f"  Cost: ${cost:.4f}")
     console.print(f"  Output: {output_dir}")
     console.print()
     console.print("Next: [cyan]sift review[/cyan] to approve/reject merges and relations")
@@ -826,6 +843,9 @@ def view(
     community: str | None = typer.Option(
         None, "--community", help="Focus on a specific community (e.g. 'Community 1')"
     ),
+    full: bool = typer.Option(
+        False, "--full", help="Draw every entity even on very large graphs"
+    ),
     verbose: bool = typer.Option(False, "-v", "--verbose", help="Verbose logging"),
 ) -> None:
     """Open an interactive graph visualization in your browser."""
@@ -861,6 +881,7 @@ def view(
         neighborhood=neighborhood,
         depth=depth,
         community=community,
+        aggregate=not full,
     )
 
     filters = []
@@ -14,6 +14,13 @@ import time
 
 import litellm
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # optional speedup: pip install sift-kg[fast]
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Suppress LiteLLM's verbose logging and OpenAI retry chatter
@@ -76,8 +83,114 @@ class _RateLimiter:
             self._timestamps.popleft()
 
 
+def estimate_tokens(text: str) -> int:
+    """Rough token count for budgeting (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+class CreditSemaphore:
+    """Token-budget semaphore for providers with tokens-per-minute limits.
+
+    Unlike asyncio.Semaphore, each holder reserves a variable number of
+    credits (estimated tokens). Credits flow back ``refund_time`` seconds
+    after the reservation — matching the provider's rolling window — or on
+    completion if the call outlasts the window. Waiters are served in FIFO
+    order so a large batch isn't starved by a stream of small ones.
+    """
+
+    def __init__(self, max_credits: int, refund_time: float = 60.0):
+        self.max_credits = max_credits
+        self.refund_time = refund_time
+        self._available = max_credits
+        self._waiters: collections.deque[tuple[int, asyncio.Future]] = collections.deque()
+
+    @property
+    def available(self) -> int:
+        return self._available
+
+    async def acquire(self, credits: int) -> int:
+        """Reserve credits, waiting until enough are free.
+
+        Requests larger than the whole budget are clamped to it, otherwise
+        they could never be granted.
+
+        Returns:
+            The number of credits actually reserved.
+        """
+        credits = max(0, min(credits, self.max_credits))
+        if not self._waiters and credits <= self._available:
+            self._available -= credits
+            return credits
+
+        fut = asyncio.get_running_loop().create_future()
+        entry = (credits, fut)
+        self._waiters.append(entry)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Granted just before cancellation — hand the credits back
+                self.release(credits)
+            else:
+                self._waiters.remove(entry)
+                self._wake()
+            raise
+        return credits
+
+    def release(self, credits: int) -> None:
+        """Return credits to the pool and wake waiters that now fit."""
+        self._available = min(self.max_credits, self._available + credits)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters:
+            credits, fut = self._waiters[0]
+            if fut.done():
+                self._waiters.popleft()
+                continue
+            if credits > self._available:
+                break
+            self._waiters.popleft()
+            self._available -= credits
+            fut.set_result(None)
+
+    async def transact(self, coro, credits: int, refund_time: float | None = None):
+        """Await ``coro`` while holding ``credits``, then schedule the refund."""
+        refund = self.refund_time if refund_time is None else refund_time
+        try:
+            granted = await self.acquire(credits)
+        except BaseException:
+            coro.close()
+            raise
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            return await coro
+        finally:
+            delay = started + refund - loop.time()
+            if delay > 0:
+                loop.call_later(delay, self.release, granted)
+            else:
+                self.release(granted)
+
+
+def _json_response_format(model: str) -> dict | None:
+    """JSON-object response format if the provider supports it, else None."""
+    try:
+        supported = litellm.get_supported_openai_params(model=model) or []
+    except Exception:
+        return None
+    return {"type": "json_object"} if "response_format" in supported else None
+
+
 class LLMClient:
-    """LLM client with retry logic, cost tracking, and rate limiting."""
+    """LLM client with retry logic, cost tracking, and rate limiting.
+
+    With ``json_mode``, call_json/acall_json ask the provider for a JSON
+    object response (where supported), so replies arrive without code
+    fences or prose and malformed-JSON retries become rare.
+    """
 
     def __init__(
         self,
@@ -88,6 +201,7 @@ class LLMClient:
         rpm: int = 40,
         timeout: int = 120,
         system_message: str = "",
+        json_mode: bool = False,
     ):
         self.model = model
         self.max_retries = max_retries
@@ -99,6 +213,27 @@ class LLMClient:
         self.total_input_tokens = 0
         self.total_output_tokens = 0
         self._limiter = _RateLimiter(rpm)
+        self._response_format = _json_response_format(model) if json_mode else None
+
+    def with_model(self, model: str) -> "LLMClient":
+        """Create a client for another model that shares this client's rate limit.
+
+        Retry, timeout, and JSON settings are copied; cost and token
+        counters start at zero. Requests from both clients count against
+        the same RPM budget.
+        """
+        client = LLMClient(
+            model=model,
+            max_retries=self.max_retries,
+            rate_limit_retries=self.rate_limit_retries,
+            rate_limit_base_wait=self.rate_limit_base_wait,
+            rpm=self._limiter.rpm,
+            timeout=self.timeout,
+            system_message=self.system_message,
+            json_mode=self._response_format is not None,
+        )
+        client._limiter = self._limiter
+        return client
 
     def _build_messages(self, prompt: str, system_message: str | None) -> list[dict]:
         effective_system = system_message or self.system_message
@@ -117,10 +252,16 @@ class LLMClient:
         if cost:
             self.total_cost_usd += cost
 
-    def call(self, prompt: str, system_message: str | None = None) -> str:
+    def call(
+        self,
+        prompt: str,
+        system_message: str | None = None,
+        response_format: dict | None = None,
+    ) -> str:
         """Call the LLM and return the text response."""
         last_error = None
         messages = self._build_messages(prompt, system_message)
+        extra = {"response_format": response_format} if response_format else {}
 
         rate_limit_hits = 0
         error_retries = 0
@@ -133,6 +274,7 @@ class LLMClient:
                     messages=messages,
                     timeout=self.timeout,
                     temperature=0.1,
+                    **extra,
                 )
                 self._track_usage(response)
 
@@ -182,13 +324,21 @@ class LLMClient:
 
     def call_json(self, prompt: str, system_message: str | None = None) -> dict:
         """Call LLM and parse the response as JSON."""
-        text = self.call(prompt, system_message=system_message)
+        text = self.call(
+            prompt, system_message=system_message, response_format=self._response_format,
+        )
         return parse_llm_json(text)
 
-    async def acall(self, prompt: str, system_message: str | None = None) -> str:
+    async def acall(
+        self,
+        prompt: str,
+        system_message: str | None = None,
+        response_format: dict | None = None,
+    ) -> str:
         """Async version of call(). Rate-limited via shared token bucket."""
         last_error = None
         messages = self._build_messages(prompt, system_message)
+        extra = {"response_format": response_format} if response_format else {}
 
         rate_limit_hits = 0
         error_retries = 0
@@ -201,6 +351,7 @@ class LLMClient:
                     messages=messages,
                     timeout=self.timeout,
                     temperature=0.1,
+                    **extra,
                 )
                 self._track_usage(response)
 
@@ -252,10 +403,15 @@ class LLMClient:
 
     async def acall_json(self, prompt: str, system_message: str | None = None) -> dict:
         """Async version of call_json()."""
-        text = await self.acall(prompt, system_message=system_message)
+        text = await self.acall(
+            prompt, system_message=system_message, response_format=self._response_format,
+        )
         return parse_llm_json(text)
 
 
+_JSON_DECODER = json.JSONDecoder()
+
+
 def parse_llm_json(text: str) -> dict:
     """Parse JSON from LLM response, handling common quirks.
 
@@ -266,26 +422,21 @@ def parse_llm_json(text: str) -> dict:
     text = re.sub(r"^```(?:json)?\s*\n?", "", text.strip())
     text = re.sub(r"\n?```\s*$", "", text.strip())
 
-    # Try direct parse
+    # Try direct parse (orjson's decode errors subclass json.JSONDecodeError)
     try:
-        return json.loads(text)
+        return orjson.loads(text) if ORJSON_AVAILABLE else json.loads(text)
     except json.JSONDecodeError:
         pass
 
-    # Try to find a valid JSON object by scanning for balanced braces
-    for i, ch in enumerate(text):
-        if ch == "{":
-            depth = 0
-            for j in range(i, len(text)):
-                if text[j] == "{":
-                    depth += 1
-                elif text[j] == "}":
-                    depth -= 1
-                if depth == 0:
-                    try:
-                        return json.loads(text[i : j + 1])
-                    except json.JSONDecodeError:
-                        break
-            break
+    # Decode the first JSON object and stop at its closing brace, ignoring
+    # any leading or trailing chatter. raw_decode tracks string literals,
+    # so braces inside values don't throw off the match.
+    start = text.find("{")
+    if start != -1:
+        try:
+            obj, _end = _JSON_DECODER.raw_decode(text, start)
+            return obj
+        except json.JSONDecodeError:
+            pass
 
     raise ValueError(f"Could not parse JSON from LLM response: {text[:200]}...")
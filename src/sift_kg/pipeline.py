@@ -161,6 +161,9 @@ def run_resolve(
     use_embeddings: bool = False,
     concurrency: int = 4,
     rpm: int = 40,
+    tpm: int = 0,
+    force: bool = False,
+    small_model: str | None = None,
 ) -> MergeFile:
     """Find duplicate entities using LLM-based resolution.
 
@@ -171,10 +174,15 @@ def run_resolve(
         use_embeddings: Use semantic clustering for batching (requires sift-kg[embeddings])
         concurrency: Concurrent LLM calls
         rpm: Max requests per minute
+        tpm: Max tokens per minute across resolve batches (0 = unlimited)
+        force: Re-query the LLM for every batch, ignoring cached responses
+        small_model: Cheaper LLM model string for small batches (falls back to model);
+            shares the rpm limit with model
 
     Returns:
         MergeFile with DRAFT proposals
     """
+    from sift_kg.resolve.cache import ResolveCache
     from sift_kg.resolve.io import write_proposals
     from sift_kg.resolve.resolver import find_merge_candidates
 
@@ -183,11 +191,14 @@ def run_resolve(
         raise FileNotFoundError(f"No graph found at {graph_path}")
 
     kg = KnowledgeGraph.load(graph_path)
-    llm = LLMClient(model=model, rpm=rpm)
+    llm = LLMClient(model=model, rpm=rpm, json_mode=True)
+    small_llm = llm.with_model(small_model) if small_model else None
     system_context = domain.system_context if domain else ""
+    cache = ResolveCache(output_dir / "resolve_cache.json", model, fresh=force)
     merge_file, variant_relations = find_merge_candidates(
         kg, llm, concurrency=concurrency,
-        use_embeddings=use_embeddings, system_context=system_context,
+        use_embeddings=use_embeddings, system_context=system_context, tpm=tpm,
+        cache=cache, small_llm=small_llm,
     )
 
     if merge_file.proposals:
@@ -0,0 +1,64 @@
+"""On-disk cache of LLM resolve responses.
+
+Re-running ``sift resolve`` on an unchanged graph sends byte-identical
+prompts, so responses are stored keyed by a hash of model, system message
+and prompt. Any change to the entities in a batch, their order, the
+domain context or the model yields a new key — stale answers are never
+served, they just stop being hit.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class ResolveCache:
+    """JSON-file cache mapping prompt hashes to parsed LLM responses.
+
+    Args:
+        path: Cache file location (created on first save)
+        model: LLM model string, part of every key
+        fresh: Start empty instead of loading ``path``; the next save
+            replaces the old file
+    """
+
+    def __init__(self, path: Path, model: str, fresh: bool = False):
+        self.path = path
+        self.model = model
+        self.hits = 0
+        self._entries: dict[str, dict] = {}
+        self._dirty = fresh
+        if not fresh and path.exists():
+            try:
+                self._entries = json.loads(path.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable resolve cache {path}: {e}")
+
+    def key(self, prompt: str, system_message: str = "", model: str | None = None) -> str:
+        """Hash everything that determines the LLM's answer.
+
+        ``model`` overrides the cache's default model for routed calls.
+        """
+        payload = "\0".join((model or self.model, system_message, prompt))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        data = self._entries.get(key)
+        if data is not None:
+            self.hits += 1
+        return data
+
+    def put(self, key: str, data: dict) -> None:
+        self._entries[key] = data
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache back to disk if anything was added."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._entries, ensure_ascii=False))
+        self._dirty = False
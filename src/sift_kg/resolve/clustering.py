@@ -1,92 +1,110 @@
-"""Embedding-based entity clustering for semantic batching.
+"""Embedding-based entity blocking for semantic batching.
 
-Replaces alphabetical sort + overlapping window batching with KMeans
-clustering on sentence embeddings. Entities with semantically similar
-names/aliases end up in the same cluster for LLM comparison.
+Replaces alphabetical sort + overlapping window batching with cosine
+top-k blocking on sentence embeddings: near-identical names are merged
+outright and only ambiguous pairs are grouped into blocks for the LLM.
 
 Requires: pip install sift-kg[embeddings]
 """
 
+import functools
 import logging
 
+from sift_kg.resolve.unionfind import components, union
+
 logger = logging.getLogger(__name__)
 
 try:
+    import numpy as np
     from sentence_transformers import SentenceTransformer
-    from sklearn.cluster import KMeans
 
     EMBEDDINGS_AVAILABLE = True
 except ImportError:
     EMBEDDINGS_AVAILABLE = False
 
 
-def cluster_entities_by_embedding(
+@functools.lru_cache(maxsize=2)
+def _load_model(model_name: str) -> "SentenceTransformer":
+    """Load a sentence transformer once per process.
+
+    Loading takes seconds while encoding a few hundred names takes
+    milliseconds, so every entity type shares the same instance.
+    """
+    return SentenceTransformer(model_name)
+
+
+def block_entities_by_embedding(
     entities: list[dict],
     model_name: str = "all-MiniLM-L6-v2",
-    target_cluster_size: int = 100,
-) -> list[list[dict]]:
-    """Group entities into semantic clusters for LLM comparison.
-
-    Entities with similar names/aliases land in the same batch,
-    regardless of alphabetical order.
+    merge_threshold: float = 0.97,
+    review_threshold: float = 0.75,
+    top_k: int = 10,
+) -> tuple[list[list[dict]], list[list[dict]]]:
+    """Split entities into obvious duplicates and ambiguous blocks.
+
+    Each entity is compared against its top_k nearest names by cosine
+    similarity. Pairs above merge_threshold are deterministic duplicates
+    and need no LLM call; pairs between review_threshold and
+    merge_threshold are linked into blocks for LLM review. Entities with
+    no neighbor above review_threshold are dropped from both.
 
     Args:
-        entities: List of entity dicts with 'name' and optional 'aliases'
+        entities: List of entity dicts with 'name'
         model_name: Sentence transformer model to use
-        target_cluster_size: Approximate entities per cluster
+        merge_threshold: Similarity above which names are merged outright
+        review_threshold: Similarity above which a pair goes to the LLM
+        top_k: Nearest neighbors considered per entity
+
     Returns:
-        List of entity clusters (each cluster is a list of entity dicts)
+        Tuple of (duplicate groups, review blocks). Every group and block
+        has at least two entities.
 
     Raises:
-        ImportError: If sentence-transformers or sklearn not installed
+        ImportError: If sentence-transformers is not installed
     """
     if not EMBEDDINGS_AVAILABLE:
         raise ImportError(
-            "Embedding clustering requires sentence-transformers and scikit-learn. "
+            "Embedding blocking requires sentence-transformers. "
             "Install with: pip install sift-kg[embeddings]"
         )
 
-    if len(entities) < 10:
-        return [entities]
-
-    n_clusters = max(1, len(entities) // target_cluster_size)
-    if n_clusters == 1:
-        return [entities]
-
-    # Build text per entity: name + aliases for richer embedding
-    texts = []
-    for entity in entities:
-        aliases = entity.get("aliases", [])
-        if isinstance(aliases, str):
-            aliases = [aliases]
-        text = entity["name"]
-        if aliases:
-            text += " " + " ".join(aliases)
-        texts.append(text)
-
-    logger.info(
-        f"Clustering {len(entities)} entities into ~{n_clusters} groups "
-        f"(model: {model_name})"
+    n = len(entities)
+    if n < 2:
+        return [], []
+
+    model = _load_model(model_name)
+    embeddings = model.encode(
+        [e["name"] for e in entities],
+        batch_size=256,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False,
     )
 
-    model = SentenceTransformer(model_name)
-    embeddings = model.encode(texts, show_progress_bar=False)
-
-    kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-    labels = kmeans.fit_predict(embeddings)
-
-    # Group entities by cluster label
-    clusters: dict[int, list[dict]] = {}
-    for entity, label in zip(entities, labels, strict=True):
-        clusters.setdefault(int(label), []).append(entity)
-
-    result = list(clusters.values())
-
-    # Log cluster size distribution
-    sizes = sorted(len(c) for c in result)
+    merge_parent = list(range(n))
+    review_parent = list(range(n))
+    k = min(top_k, n - 1)
+
+    # Row blocks keep the similarity matrix at O(rows * n) memory
+    row_block = 1024
+    for start in range(0, n, row_block):
+        sims = embeddings[start:start + row_block] @ embeddings.T
+        rows = np.arange(sims.shape[0])
+        sims[rows, rows + start] = -1.0  # ignore self-similarity
+        top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        for r, neighbors in enumerate(top):
+            i = start + r
+            for j in neighbors:
+                sim = sims[r, j]
+                if sim > merge_threshold:
+                    union(merge_parent, i, int(j))
+                elif sim > review_threshold:
+                    union(review_parent, i, int(j))
+
+    merge_groups = components(merge_parent, entities)
+    review_blocks = components(review_parent, entities)
     logger.info(
-        f"Cluster sizes: min={sizes[0]}, max={sizes[-1]}, "
-        f"median={sizes[len(sizes) // 2]}, count={len(result)}"
+        f"Embedding blocking: {len(merge_groups)} duplicate groups, "
+        f"{len(review_blocks)} blocks ({sum(len(b) for b in review_blocks)} entities) for LLM review"
     )
-
-    return result
+    return merge_groups, review_blocks
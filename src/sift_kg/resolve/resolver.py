@@ -8,20 +8,38 @@ Uses async concurrency to process type batches in parallel.
 """
 
 import asyncio
+import functools
 import json
 import logging
+from collections import defaultdict
 
-from unidecode import unidecode
+try:
+    from anyascii import anyascii as _ascii_fold
+except ImportError:  # anyascii is optional; unidecode is the slower fallback
+    from unidecode import unidecode as _ascii_fold
 
-from sift_kg.extract.llm_client import LLMClient
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # optional speedup: pip install sift-kg[fast]
+    ORJSON_AVAILABLE = False
+
+from sift_kg.extract.llm_client import (
+    CreditSemaphore,
+    LLMClient,
+    estimate_tokens,
+)
 from sift_kg.graph.knowledge_graph import KnowledgeGraph
 from sift_kg.graph.prededup import _TITLE_PREFIXES
+from sift_kg.resolve.cache import ResolveCache
 from sift_kg.resolve.models import (
     MergeFile,
     MergeMember,
     MergeProposal,
     RelationReviewEntry,
 )
+from sift_kg.resolve.unionfind import components, union
 
 logger = logging.getLogger(__name__)
 
@@ -36,14 +54,99 @@ MAX_BATCH_SIZE = 100
 # appear in both, eliminating cross-batch blind spots.
 BATCH_OVERLAP = 20
 
+# Estimated prompt tokens per batch. Typical entities stay well under this
+# at MAX_BATCH_SIZE; it only splits windows of long names/aliases so one
+# verbose batch doesn't become the straggler every other batch waits on.
+MAX_BATCH_TOKENS = 4000
+
+# Batches this small are easy enough for the cheaper model when one is
+# configured (see find_merge_candidates' small_llm).
+SMALL_BATCH_SIZE = 5
+
+
+# Resolve prompt pieces. Kept as byte-identical module constants, with the
+# per-batch entity list last, so providers can cache the shared prefix.
+_RESOLVE_INSTRUCTIONS = """Analyze the entities listed at the end and identify:
+1. **Duplicates** — entities that refer to the exact same thing (merge them)
+2. **Variants** — entities that are a subtype, version, or specific implementation of a parent entity (link them with EXTENDS)
+
+IMPORTANT: If entity B is a variant/subtype/version of entity A (not the same thing, but derived from it), put it in "variants" NOT "groups". Only true duplicates go in "groups".
 
+Return valid JSON only:
+{
+  "groups": [
+    {
+      "canonical_id": "id of the best/most complete entity",
+      "canonical_name": "the preferred name",
+      "member_ids": ["id1", "id2"],
+      "confidence": 0.0-1.0,
+      "reason": "brief explanation"
+    }
+  ],
+  "variants": [
+    {
+      "parent_id": "id of the parent/base entity",
+      "child_id": "id of the variant/subtype",
+      "confidence": 0.0-1.0,
+      "reason": "brief explanation"
+    }
+  ]
+}
+
+If nothing found, return {"groups": [], "variants": []}."""
+
+_PERSON_TYPES = {"PERSON", "RESEARCHER"}
+
+# Only send identity-relevant attributes — full attribute dicts drown out
+# name/alias signals and waste tokens.
+_IDENTITY_KEYS = ("role", "title", "occupation", "position", "aka")
+
+# Caps on prompt payload per entity. OCR'd or run-on names and long
+# attribute values cost tokens without helping the duplicate judgment.
+_MAX_PROMPT_CHARS = 80
+_MAX_PROMPT_ALIASES = 5
+
+_PERSON_TYPE_HINTS = """Look for:
+- Name variations (abbreviations, nicknames, full legal names vs common names, misspellings, transliterations)
+- Title/honorific prefixes that don't change identity (Dr., Mr., Detective, Judge, etc.)
+- First name vs nickname variants
+- Aliases — if an entity's aliases list contains a name matching another entity, they are very likely the same
+- Same person referenced differently across documents
+- DO NOT merge genuinely different people (e.g., father and son, or unrelated people sharing a surname)"""
+
+_GENERIC_TYPE_HINTS = """Look for:
+- Acronyms vs spelled-out forms of the same thing
+- Spacing, punctuation, and capitalization variants of the same name
+- A name with and without a redundant qualifier (e.g. "X method" vs just "X")
+- Same entity referenced with slightly different wording across documents
+- Aliases — if an entity's aliases list contains a name matching another entity, they are very likely the same
+- DO NOT merge entities that are genuinely distinct variants, versions, or subtypes of each other"""
+
+_PERSON_PROMPT_PREFIX = f"{_RESOLVE_INSTRUCTIONS}\n\n{_PERSON_TYPE_HINTS}"
+_GENERIC_PROMPT_PREFIX = f"{_RESOLVE_INSTRUCTIONS}\n\n{_GENERIC_TYPE_HINTS}"
+
+
+def _normalize_aliases(attrs: dict) -> list[str]:
+    """Return an entity's aliases as a list.
+
+    Extraction stores them under "aliases" or "also_known_as", either as a
+    list or as a single string.
+    """
+    aliases = attrs.get("aliases") or attrs.get("also_known_as") or []
+    return [aliases] if isinstance(aliases, str) else list(aliases)
+
+
+@functools.lru_cache(maxsize=65536)
 def _person_sort_key(name: str) -> str:
     """Sort PERSON entities by surname so title/first-name variants cluster.
 
     "Mr. Edwards", "Bradley Edwards", "Edwards" all sort under "edwards".
     "Detective Joe Recarey", "Joseph Recarey" sort under "recarey".
+
+    Cached: the same names are keyed again for the fallback batching path
+    and for repeated resolve runs in one process.
     """
-    normalized = unidecode(name).lower().strip()
+    normalized = _ascii_fold(name).lower().strip()
     # Strip title prefixes
     changed = True
     while changed:
@@ -66,6 +169,9 @@ def find_merge_candidates(
     concurrency: int = 4,
     use_embeddings: bool = False,
     system_context: str = "",
+    tpm: int = 0,
+    cache: ResolveCache | None = None,
+    small_llm: LLMClient | None = None,
 ) -> tuple[MergeFile, list[RelationReviewEntry]]:
     """Find entities that likely refer to the same real-world thing.
 
@@ -76,12 +182,21 @@ def find_merge_candidates(
         concurrency: Max concurrent LLM calls
         use_embeddings: Use semantic clustering instead of alphabetical batching
         system_context: Domain context to help LLM understand entity names
+        tpm: Provider tokens-per-minute budget. Large batches reserve more
+            of it than small ones. 0 disables token budgeting.
+        cache: On-disk response cache. Batches whose prompt was already
+            answered are not sent to the LLM again.
+        small_llm: Cheaper client for batches of at most SMALL_BATCH_SIZE
+            entities. Falls back to ``llm`` if its call fails.
 
     Returns:
         Tuple of (MergeFile with DRAFT proposals, list of variant relation proposals)
     """
     return asyncio.run(
-        _afind_merge_candidates(kg, llm, entity_types, concurrency, use_embeddings, system_context)
+        _afind_merge_candidates(
+            kg, llm, entity_types, concurrency, use_embeddings, system_context, tpm,
+            cache, small_llm,
+        )
     )
 
 
@@ -92,43 +207,61 @@ async def _afind_merge_candidates(
     concurrency: int,
     use_embeddings: bool = False,
     system_context: str = "",
+    tpm: int = 0,
+    cache: ResolveCache | None = None,
+    small_llm: LLMClient | None = None,
 ) -> tuple[MergeFile, list[RelationReviewEntry]]:
     """Async implementation — resolves all type batches concurrently."""
-    if entity_types:
-        types_to_check = entity_types
-    else:
-        # Resolve all entity types present in the graph, except DOCUMENT
-        types_to_check = sorted({
-            data.get("entity_type")
-            for _, data in kg.graph.nodes(data=True)
-            if data.get("entity_type") and data.get("entity_type") not in SKIP_TYPES
+    # One pass over the graph buckets entities by type. By default all
+    # types present in the graph are resolved, except DOCUMENT.
+    wanted = set(entity_types) if entity_types else None
+    buckets: dict[str, list[dict]] = defaultdict(list)
+    for nid, data in kg.graph.nodes(data=True):
+        entity_type = data.get("entity_type")
+        if not entity_type:
+            continue
+        if wanted is not None:
+            skip = entity_type not in wanted
+        else:
+            skip = entity_type in SKIP_TYPES
+        if skip:
+            continue
+        attrs = data.get("attributes", {})
+        buckets[entity_type].append({
+            "id": nid,
+            "name": data.get("name", ""),
+            "aliases": _normalize_aliases(attrs),
+            "attributes": attrs,
         })
 
-    # Build all (batch, entity_type) pairs
-    tasks = []
+    types_to_check = entity_types if entity_types else sorted(buckets)
+
+    # Every (batch, entity_type) pair runs as its own task, bounded by sem
+    tasks: list[asyncio.Task] = []
+    # Proposals decided without the LLM (exact names, embedding duplicates)
+    direct_proposals: list[MergeProposal] = []
     sem = asyncio.Semaphore(concurrency)
+    # Token budget: a 100-entity batch costs several times a 20-entity one,
+    # so budget by estimated tokens rather than by call count.
+    credits = CreditSemaphore(max_credits=tpm, refund_time=60.0) if tpm > 0 else None
 
     for entity_type in types_to_check:
-        entities = []
-        for nid, data in kg.graph.nodes(data=True):
-            if data.get("entity_type") != entity_type:
-                continue
-            attrs = data.get("attributes", {})
-            aliases = attrs.get("aliases", []) or attrs.get("also_known_as", [])
-            if isinstance(aliases, str):
-                aliases = [aliases]
-            entities.append({
-                "id": nid,
-                "name": data.get("name", ""),
-                "aliases": aliases,
-                "attributes": attrs,
-            })
-
+        entities = buckets.get(entity_type, [])
         if len(entities) < 2:
             continue
 
+        # id -> name for every entity of this type, shared by all its batches
+        name_lookup = {e["id"]: e["name"] for e in entities}
+
         logger.info(f"Resolving {len(entities)} {entity_type} entities")
 
+        # Identical names/aliases need no LLM; only one representative of
+        # each such group stays in the batches.
+        exact_proposals, entities = _exact_match_groups(entities, entity_type)
+        direct_proposals.extend(exact_proposals)
+        if len(entities) < 2:
+            continue
+
         # Build batches: semantic clustering or surname/alphabetical windows
         sort_key = (
             (lambda e: _person_sort_key(e["name"]))
@@ -138,9 +271,23 @@ async def _afind_merge_candidates(
 
         if use_embeddings:
             try:
-                from sift_kg.resolve.clustering import cluster_entities_by_embedding
-
-                batches = cluster_entities_by_embedding(entities)
+                from sift_kg.resolve.clustering import block_entities_by_embedding
+
+                # Near-identical names merge without an LLM call; only
+                # ambiguous pairs are grouped into blocks for the LLM.
+                # Off the event loop, so batches already scheduled for
+                # earlier types keep their LLM calls in flight meanwhile.
+                duplicate_groups, blocks = await asyncio.to_thread(
+                    block_entities_by_embedding, entities,
+                )
+                direct_proposals.extend(_proposals_from_groups(
+                    duplicate_groups, entity_type,
+                    "Near-identical names (embedding similarity > 0.97).",
+                ))
+                batches = []
+                for block in blocks:
+                    block.sort(key=sort_key)
+                    batches.extend(_build_overlapping_batches(block))
             except ImportError:
                 logger.warning(
                     "Embedding clustering unavailable, falling back"
@@ -161,21 +308,43 @@ async def _afind_merge_candidates(
             if len(batches) > 1:
                 logger.info(f"  Batch {batch_idx + 1}/{len(batches)}: {len(batch)} entities")
 
-            async def _bounded(b: list[dict], et: str) -> tuple[list[MergeProposal], list[RelationReviewEntry]]:
-                async with sem:
-                    return await _aresolve_type_batch(b, et, llm, system_context)
-
-            tasks.append(_bounded(batch, entity_type))
+            # Schedule immediately: batches start as soon as they are built
+            # instead of waiting for every type to be batched first.
+            tasks.append(asyncio.create_task(
+                _bounded(
+                    len(tasks) + 1, sem, batch, entity_type, llm, system_context,
+                    credits, name_lookup, cache, small_llm,
+                )
+            ))
 
-    if not tasks:
+    if not tasks and not direct_proposals:
         return MergeFile(proposals=[]), []
 
-    batch_results = await asyncio.gather(*tasks)
-    all_proposals = [p for proposals, _ in batch_results for p in proposals]
-    all_variants = [v for _, variants in batch_results for v in variants]
-
-    # Overlapping windows can produce duplicate proposals — deduplicate.
-    all_proposals = _deduplicate_proposals(all_proposals)
+    # Overlapping windows can produce duplicate proposals — fold each batch
+    # into the dedup state as it completes instead of after the last one.
+    # Ties break on submission order, so completion order never changes
+    # the result.
+    by_canonical: dict[str, tuple[MergeProposal, tuple[float, int, int]]] = {}
+    for proposal in direct_proposals:
+        _merge_into(by_canonical, proposal)
+
+    variants_by_order: dict[int, list[RelationReviewEntry]] = {}
+    for next_done in asyncio.as_completed(tasks):
+        order, proposals, variants = await next_done
+        for proposal in proposals:
+            _merge_into(by_canonical, proposal, order)
+        variants_by_order[order] = variants
+    all_variants = [v for order in sorted(variants_by_order) for v in variants_by_order[order]]
+
+    if cache is not None:
+        cache.save()
+        if cache.hits:
+            logger.info(f"Reused {cache.hits} cached resolve responses")
+
+    all_proposals = sorted(
+        (proposal for proposal, _ in by_canonical.values()),
+        key=lambda p: (p.entity_type, p.canonical_id),
+    )
 
     # Cross-type dedup: find entities with same name but different types.
     # No LLM needed — if the name is identical, it's almost certainly the
@@ -187,6 +356,115 @@ async def _afind_merge_candidates(
     return MergeFile(proposals=all_proposals), all_variants
 
 
+async def _bounded(
+    order: int,
+    sem: asyncio.Semaphore,
+    batch: list[dict],
+    entity_type: str,
+    llm: LLMClient,
+    system_context: str,
+    credits: CreditSemaphore | None,
+    name_lookup: dict[str, str] | None = None,
+    cache: ResolveCache | None = None,
+    small_llm: LLMClient | None = None,
+) -> tuple[int, list[MergeProposal], list[RelationReviewEntry]]:
+    """Resolve one batch under the shared concurrency limit.
+
+    Returns the batch's submission order alongside its results.
+    """
+    async with sem:
+        proposals, variants = await _aresolve_type_batch(
+            batch, entity_type, llm, system_context, credits, name_lookup,
+            cache, small_llm,
+        )
+    return order, proposals, variants
+
+
+def _proposals_from_groups(
+    groups: list[list[dict]],
+    entity_type: str,
+    reason: str,
+) -> list[MergeProposal]:
+    """Turn deterministic duplicate groups into merge proposals.
+
+    The longest name is taken as canonical (likely the most complete form).
+    """
+    proposals = []
+    for group in groups:
+        ranked = sorted(group, key=lambda e: (-len(e["name"]), e["name"]))
+        canonical = ranked[0]
+        proposals.append(MergeProposal(
+            canonical_id=canonical["id"],
+            canonical_name=canonical["name"],
+            entity_type=entity_type,
+            status="DRAFT",
+            members=[
+                MergeMember(id=e["id"], name=e["name"], confidence=0.95)
+                for e in ranked[1:]
+            ],
+            reason=reason,
+        ))
+    return proposals
+
+
+def _exact_match_groups(
+    entities: list[dict],
+    entity_type: str,
+) -> tuple[list[MergeProposal], list[dict]]:
+    """Group entities whose folded name matches another's name or alias.
+
+    Names are compared after accent/case folding only; titles are kept
+    ("Mr. Smith" and "Mrs. Smith" are not the same person). An alias only
+    links to another entity's *name* — two entities merely sharing an
+    alias are left for the LLM.
+
+    Returns:
+        Tuple of (proposals, entities still needing LLM review). Each
+        group keeps only its canonical entity in the returned list.
+    """
+    parent = list(range(len(entities)))
+    by_name: dict[str, int] = {}
+    for i, e in enumerate(entities):
+        k = _fold_name(e["name"])
+        if not k:
+            continue
+        if k in by_name:
+            union(parent, i, by_name[k])
+        else:
+            by_name[k] = i
+    for i, e in enumerate(entities):
+        for alias in e.get("aliases") or []:
+            j = by_name.get(_fold_name(alias)) if isinstance(alias, str) else None
+            if j is not None:
+                union(parent, i, j)
+
+    groups = components(parent, entities)
+    if not groups:
+        return [], entities
+
+    proposals = _proposals_from_groups(
+        groups,
+        entity_type,
+        "Identical name or alias after case/accent folding.",
+    )
+    canonical_ids = {p.canonical_id for p in proposals}
+    grouped_ids = {m.id for p in proposals for m in p.members}
+    remaining = [
+        e for e in entities
+        if e["id"] not in grouped_ids or e["id"] in canonical_ids
+    ]
+    logger.info(
+        f"  {len(proposals)} exact-name groups for {entity_type} resolved without the LLM"
+    )
+    return proposals, remaining
+
+
+@functools.lru_cache(maxsize=65536)
+def _fold_name(name: str) -> str:
+    """Accent- and case-insensitive name key: "Zürich " and "ZURICH" match."""
+    return " ".join(_ascii_fold(name).casefold().split())
+
+
 def _find_cross_type_duplicates(kg: KnowledgeGraph) -> list[MergeProposal]:
     """Find entities with the same name but different types.
 
@@ -195,15 +473,13 @@ def _find_cross_type_duplicates(kg: KnowledgeGraph) -> list[MergeProposal]:
     The canonical is the one with more connections (more context for
     the type assignment). All relations get combined on merge.
     """
-    from collections import defaultdict
-
     # Group by normalized name
     name_groups: dict[str, list[tuple[str, str, int]]] = defaultdict(list)
     for nid, data in kg.graph.nodes(data=True):
         entity_type = data.get("entity_type", "")
         if entity_type in SKIP_TYPES:
             continue
-        name = data.get("name", "").strip().lower()
+        name = _fold_name(data.get("name", ""))
         if not name:
             continue
         degree = kg.graph.degree(nid)
@@ -245,75 +521,117 @@ def _find_cross_type_duplicates(kg: KnowledgeGraph) -> list[MergeProposal]:
     return proposals
 
 
+def _entity_tokens(entity: dict) -> int:
+    """Estimated prompt tokens for one entity's payload."""
+    aliases = entity.get("aliases") or []
+    return (
+        estimate_tokens(entity["id"])
+        + estimate_tokens(entity["name"][:_MAX_PROMPT_CHARS])
+        + sum(
+            estimate_tokens(a[:_MAX_PROMPT_CHARS])
+            for a in aliases[:_MAX_PROMPT_ALIASES]
+            if isinstance(a, str)
+        )
+    )
+
+
 def _build_overlapping_batches(entities: list[dict]) -> list[list[dict]]:
     """Split entities into batches with overlap at boundaries.
 
-    For lists that fit in one batch, returns a single batch.
-    For larger lists, consecutive batches share BATCH_OVERLAP entities
-    so duplicates near boundaries are seen together.
+    Windows follow the sorted order and close at MAX_BATCH_SIZE entities
+    or MAX_BATCH_TOKENS estimated tokens, whichever comes first, so
+    batches take similar time to answer. Consecutive batches share up to
+    BATCH_OVERLAP entities so duplicates near boundaries are seen together.
     """
     n = len(entities)
-    if n <= MAX_BATCH_SIZE:
+    sizes = [_entity_tokens(e) for e in entities]
+    if n <= MAX_BATCH_SIZE and sum(sizes) <= MAX_BATCH_TOKENS:
         return [entities]
 
     batches = []
-    step = MAX_BATCH_SIZE - BATCH_OVERLAP
-    for start in range(0, n, step):
-        batch = entities[start:start + MAX_BATCH_SIZE]
+    start = 0
+    while True:
+        end = start
+        total = 0
+        # Always take two entities so an oversized one still gets compared
+        while end < n and end - start < MAX_BATCH_SIZE and (
+            end - start < 2 or total + sizes[end] <= MAX_BATCH_TOKENS
+        ):
+            total += sizes[end]
+            end += 1
+        batch = entities[start:end]
         if len(batch) < 2:
             break
         batches.append(batch)
         # Stop if this batch already reaches the end
-        if start + MAX_BATCH_SIZE >= n:
+        if end >= n:
             break
+        # Overlap never exceeds half a batch, so every window advances
+        start = end - min(BATCH_OVERLAP, len(batch) // 2)
     return batches
 
 
-def _deduplicate_proposals(proposals: list[MergeProposal]) -> list[MergeProposal]:
-    """Remove duplicate proposals from overlapping batches.
+def _proposal_rank(proposal: MergeProposal) -> tuple[float, int]:
+    """Rank duplicate proposals: highest average confidence, then most members."""
+    members = proposal.members
+    return sum(m.confidence for m in members) / max(1, len(members)), len(members)
 
-    When the same canonical_id appears in multiple proposals, keep the one
-    with the most members (and highest average confidence as tiebreaker).
-    Merge member lists from duplicates to catch cross-batch matches.
-    """
-    by_canonical: dict[str, list[MergeProposal]] = {}
-    for p in proposals:
-        by_canonical.setdefault(p.canonical_id, []).append(p)
-
-    deduped = []
-    for canonical_id, group in by_canonical.items():
-        if len(group) == 1:
-            deduped.append(group[0])
-            continue
 
-        # Merge members from all proposals for this canonical entity.
-        # Keep highest confidence per member.
-        seen_members: dict[str, MergeMember] = {}
-        best_reason = ""
-        best_confidence = 0.0
-        entity_type = group[0].entity_type
-        canonical_name = group[0].canonical_name
-
-        for p in group:
-            avg_conf = sum(m.confidence for m in p.members) / len(p.members) if p.members else 0
-            if avg_conf > best_confidence:
-                best_confidence = avg_conf
-                best_reason = p.reason
-                canonical_name = p.canonical_name
-            for m in p.members:
-                if m.id not in seen_members or m.confidence > seen_members[m.id].confidence:
-                    seen_members[m.id] = m
-
-        deduped.append(MergeProposal(
-            canonical_id=canonical_id,
-            canonical_name=canonical_name,
-            entity_type=entity_type,
+def _merge_into(
+    by_canonical: dict[str, tuple[MergeProposal, tuple[float, int, int]]],
+    proposal: MergeProposal,
+    order: int = 0,
+) -> None:
+    """Fold one proposal into running dedup state keyed by canonical_id.
+
+    Each entry holds the merged proposal and the best rank seen so far.
+    Member lists are unioned keeping the highest confidence per member;
+    reason and canonical name come from the best-ranked proposal, with
+    equal ranks going to the lowest ``order`` (batch submission index).
+    """
+    rank = (*_proposal_rank(proposal), -order)
+    existing = by_canonical.get(proposal.canonical_id)
+    if existing is None:
+        by_canonical[proposal.canonical_id] = (proposal, rank)
+        return
+
+    current, best_rank = existing
+    best = proposal if rank > best_rank else current
+    by_canonical[proposal.canonical_id] = (
+        MergeProposal(
+            canonical_id=proposal.canonical_id,
+            canonical_name=best.canonical_name,
+            entity_type=current.entity_type,
             status="DRAFT",
-            members=list(seen_members.values()),
-            reason=best_reason,
-        ))
+            members=_union_members([current, proposal]),
+            reason=best.reason,
+        ),
+        max(rank, best_rank),
+    )
 
-    return deduped
+
+def _union_members(group: list[MergeProposal]) -> list[MergeMember]:
+    """Union member lists, keeping the highest-confidence entry per id.
+
+    Members are ordered by confidence, then id, independent of the order
+    the proposals arrived in.
+    """
+    seen: dict[str, MergeMember] = {}
+    for p in group:
+        for m in p.members:
+            prev = seen.get(m.id)
+            if prev is None or m.confidence > prev.confidence:
+                seen[m.id] = m
+    return sorted(seen.values(), key=lambda m: (-m.confidence, m.id))
+
+
+def _coerce_confidence(value: object, default: float) -> float:
+    """Parse an LLM-reported confidence, clamped to [0, 1]."""
+    try:
+        confidence = float(value)
+    except (TypeError, ValueError):
+        return default
+    return min(1.0, max(0.0, confidence))
 
 
 def _strip_person_titles(name: str) -> str:
@@ -321,7 +639,7 @@ def _strip_person_titles(name: str) -> str:
 
     Returns the stripped name, or the original if nothing changed.
     """
-    normalized = unidecode(name).strip()
+    normalized = _ascii_fold(name).strip()
     lower = normalized.lower()
     changed = True
     while changed:
@@ -335,19 +653,24 @@ def _strip_person_titles(name: str) -> str:
     return normalized
 
 
-async def _aresolve_type_batch(
-    entities: list[dict],
-    entity_type: str,
-    llm: LLMClient,
-    system_context: str = "",
-) -> list[MergeProposal]:
-    """Ask LLM to identify duplicate entities within a type (async)."""
-    # Only send identity-relevant fields — full attribute dicts drown out
-    # name/alias signals and waste tokens.
-    identity_keys = {"role", "title", "occupation", "position", "aka"}
+def _dumps_compact(obj: object) -> str:
+    """Serialize to compact JSON, via orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    # Same bytes orjson produces: UTF-8 text, no spaces after separators
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _clip(value: object) -> object:
+    """Truncate string values to _MAX_PROMPT_CHARS; pass others through."""
+    return value[:_MAX_PROMPT_CHARS] if isinstance(value, str) else value
+
+
+def _build_resolve_prompt(entities: list[dict], entity_type: str) -> str:
+    """Build the resolve prompt: constant per-type prefix, then the entities."""
     entity_dicts = []
     for e in entities:
-        entry: dict = {"id": e["id"], "name": e["name"]}
+        entry: dict = {"id": e["id"], "name": e["name"][:_MAX_PROMPT_CHARS]}
         aliases = list(e.get("aliases") or [])
 
         # For PERSON entities, strip titles and add the bare name as an alias
@@ -358,113 +681,106 @@ async def _aresolve_type_batch(
                 aliases.insert(0, stripped)
 
         if aliases:
-            entry["aliases"] = aliases
+            entry["aliases"] = [_clip(a) for a in aliases[:_MAX_PROMPT_ALIASES]]
         attrs = e.get("attributes", {})
-        identity_attrs = {k: v for k, v in attrs.items() if k in identity_keys and v}
+        identity_attrs = {k: _clip(v) for k in _IDENTITY_KEYS if (v := attrs.get(k))}
         if identity_attrs:
             entry["attributes"] = identity_attrs
         entity_dicts.append(entry)
 
-    entity_list = json.dumps(entity_dicts, indent=2, ensure_ascii=False)
-
-    context_section = ""
-    if system_context:
-        context_section = f"DOMAIN CONTEXT:\n{system_context}\n\n"
-
-    # Build type-appropriate dedup hints
-    person_types = {"PERSON", "RESEARCHER"}
-    if entity_type in person_types:
-        type_hints = """Look for:
-- Name variations (abbreviations, nicknames, full legal names vs common names, misspellings, transliterations)
-- Title/honorific prefixes that don't change identity (Dr., Mr., Detective, Judge, etc.)
-- First name vs nickname variants
-- Aliases — if an entity's aliases list contains a name matching another entity, they are very likely the same
-- Same person referenced differently across documents
-- DO NOT merge genuinely different people (e.g., father and son, or unrelated people sharing a surname)"""
-    else:
-        type_hints = """Look for:
-- Acronyms vs spelled-out forms of the same thing
-- Spacing, punctuation, and capitalization variants of the same name
-- A name with and without a redundant qualifier (e.g. "X method" vs just "X")
-- Same entity referenced with slightly different wording across documents
-- Aliases — if an entity's aliases list contains a name matching another entity, they are very likely the same
-- DO NOT merge entities that are genuinely distinct variants, versions, or subtypes of each other"""
-
-    prompt = f"""{context_section}Analyze these {entity_type} entities and identify:
-1. **Duplicates** — entities that refer to the exact same thing (merge them)
-2. **Variants** — entities that are a subtype, version, or specific implementation of a parent entity (link them with EXTENDS)
-
-ENTITIES:
-{entity_list}
-
-{type_hints}
+    # One compact object per line: keeps entries visually separate for the
+    # LLM without spending tokens on indentation.
+    entity_list = "[\n" + ",\n".join(_dumps_compact(d) for d in entity_dicts) + "\n]"
 
-IMPORTANT: If entity B is a variant/subtype/version of entity A (not the same thing, but derived from it), put it in "variants" NOT "groups". Only true duplicates go in "groups".
-
-Return valid JSON only:
-{{
-  "groups": [
-    {{
-      "canonical_id": "id of the best/most complete entity",
-      "canonical_name": "the preferred name",
-      "member_ids": ["id1", "id2"],
-      "confidence": 0.0-1.0,
-      "reason": "brief explanation"
-    }}
-  ],
-  "variants": [
-    {{
-      "parent_id": "id of the parent/base entity",
-      "child_id": "id of the variant/subtype",
-      "confidence": 0.0-1.0,
-      "reason": "brief explanation"
-    }}
-  ]
-}}
+    prefix = _PERSON_PROMPT_PREFIX if entity_type in _PERSON_TYPES else _GENERIC_PROMPT_PREFIX
+    return f"{prefix}\n\n{entity_type} ENTITIES:\n{entity_list}\n\nOUTPUT JSON:"
 
-If nothing found, return {{"groups": [], "variants": []}}.
-OUTPUT JSON:"""
 
-    try:
-        data = await llm.acall_json(prompt)
-    except (RuntimeError, ValueError) as e:
-        logger.warning(f"Entity resolution failed for {entity_type}: {e}")
+async def _aresolve_type_batch(
+    entities: list[dict],
+    entity_type: str,
+    llm: LLMClient,
+    system_context: str = "",
+    credits: CreditSemaphore | None = None,
+    name_lookup: dict[str, str] | None = None,
+    cache: ResolveCache | None = None,
+    small_llm: LLMClient | None = None,
+) -> tuple[list[MergeProposal], list[RelationReviewEntry]]:
+    """Ask LLM to identify duplicate entities within a type (async).
+
+    When ``credits`` is given, the call reserves its estimated prompt
+    tokens from the shared TPM budget before going out. ``name_lookup``
+    maps id -> name for the whole type so overlapping batches share one
+    dict instead of each building their own. A ``cache`` hit skips the
+    LLM call entirely. Batches of at most SMALL_BATCH_SIZE entities try
+    ``small_llm`` first and escalate to ``llm`` if that call fails.
+    """
+    prompt = _build_resolve_prompt(entities, entity_type)
+    # Domain context goes in the system message so the user prompt's
+    # constant prefix stays byte-identical across every batch.
+    llm_kwargs = {"system_message": f"DOMAIN CONTEXT:\n{system_context}"} if system_context else {}
+
+    clients = [llm]
+    if small_llm is not None and len(entities) <= SMALL_BATCH_SIZE:
+        clients.insert(0, small_llm)
+
+    data = None
+    for client in clients:
+        cache_key = (
+            cache.key(prompt, llm_kwargs.get("system_message", ""), client.model)
+            if cache else ""
+        )
+        data = cache.get(cache_key) if cache else None
+        if data is not None:
+            break
+        try:
+            if credits is not None:
+                data = await credits.transact(
+                    client.acall_json(prompt, **llm_kwargs), estimate_tokens(prompt),
+                )
+            else:
+                data = await client.acall_json(prompt, **llm_kwargs)
+        except (RuntimeError, ValueError) as e:
+            logger.warning(f"Entity resolution failed for {entity_type} ({client.model}): {e}")
+            continue
+        if cache is not None:
+            cache.put(cache_key, data)
+        break
+    if data is None:
         return [], []
 
-    # Parse response into MergeProposals
+    # Parse response into MergeProposals. Values are clamped/coerced here,
+    # so the models are built with model_construct and skip re-validation.
     proposals = []
-    entity_lookup = {e["id"]: e["name"] for e in entities}
+    entity_lookup = name_lookup if name_lookup is not None else {e["id"]: e["name"] for e in entities}
 
     for group in data.get("groups", []):
         canonical_id = group.get("canonical_id", "")
         member_ids = group.get("member_ids", [])
-        confidence = float(group.get("confidence", 0.5))
+        confidence = _coerce_confidence(group.get("confidence"), 0.5)
 
-        if not canonical_id or len(member_ids) < 2:
+        if not canonical_id or not isinstance(canonical_id, str):
+            continue
+        if canonical_id not in entity_lookup:
+            continue
+        if not isinstance(member_ids, list) or len(member_ids) < 2:
             continue
 
-        if canonical_id not in member_ids:
-            member_ids.insert(0, canonical_id)
-
-        members = []
-        for mid in member_ids:
-            if mid != canonical_id and mid in entity_lookup:
-                members.append(MergeMember(
-                    id=mid,
-                    name=entity_lookup.get(mid, mid),
-                    confidence=confidence,
-                ))
-
+        members = [
+            MergeMember.model_construct(id=mid, name=entity_lookup[mid], confidence=confidence)
+            for mid in dict.fromkeys(member_ids)
+            if mid != canonical_id and mid in entity_lookup
+        ]
         if not members:
             continue
 
-        proposals.append(MergeProposal(
+        proposals.append(MergeProposal.model_construct(
             canonical_id=canonical_id,
-            canonical_name=entity_lookup.get(canonical_id, canonical_id),
+            canonical_name=entity_lookup[canonical_id],
             entity_type=entity_type,
             status="DRAFT",
             members=members,
-            reason=group.get("reason", ""),
+            reason=str(group.get("reason") or ""),
         ))
 
     # Parse variant relations (EXTENDS)
@@ -477,14 +793,15 @@ OUTPUT JSON:"""
         if parent_id not in entity_lookup or child_id not in entity_lookup:
             continue
 
-        variant_relations.append(RelationReviewEntry(
+        variant_relations.append(RelationReviewEntry.model_construct(
             source_id=child_id,
             source_name=entity_lookup[child_id],
             target_id=parent_id,
             target_name=entity_lookup[parent_id],
             relation_type="EXTENDS",
-            confidence=float(variant.get("confidence", 0.7)),
-            evidence=variant.get("reason", ""),
+            confidence=_coerce_confidence(variant.get("confidence"), 0.7),
+            evidence=str(variant.get("reason") or ""),
+            source_document="",
             status="DRAFT",
             flag_reason="Variant relationship discovered during entity resolution",
         ))
@@ -4,20 +4,77 @@ Presents DRAFT items one-by-one with Rich panels. User approves, rejects,
 or skips each item. Updated files are written on completion.
 """
 
+import sys
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
 from sift_kg.resolve.models import MergeFile, RelationReviewFile
 
+try:
+    import termios
+    import tty
+
+    _TERMIOS_AVAILABLE = True
+except ImportError:  # Windows
+    _TERMIOS_AVAILABLE = False
+
+try:
+    import msvcrt
+
+    _MSVCRT_AVAILABLE = True
+except ImportError:
+    _MSVCRT_AVAILABLE = False
+
 console = Console()
 
+_DECISION_PROMPT = r"  \[a]pprove  \[r]eject  \[s]kip  \[q]uit → "
+
+# (minimum confidence, style), highest first; anything lower is red
+_CONF_STYLES = ((0.8, "green"), (0.5, "yellow"))
+
+# Blank line between panel sections. Rendering doesn't mutate it, so one
+# instance is shared by every panel.
+_SPACER = Text("")
+
+# Printed after each decision, padded with the surrounding blank lines
+_OUTCOME_LINES = {
+    "a": "\n  [green]✓ Approved[/green]\n",
+    "r": "\n  [red]✗ Rejected[/red]\n",
+    "s": "\n  [dim]⏭ Skipped[/dim]\n",
+}
+
+
+def _conf_style(confidence: float) -> str:
+    """Color for a confidence value: green ≥ 0.8, yellow ≥ 0.5, else red."""
+    for threshold, style in _CONF_STYLES:
+        if confidence >= threshold:
+            return style
+    return "red"
+
+
+def _getch() -> str:
+    """Read one keypress from the terminal without waiting for Enter."""
+    if _TERMIOS_AVAILABLE:
+        fd = sys.stdin.fileno()
+        old_attrs = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            return sys.stdin.read(1)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+    return msvcrt.getwch()
+
 
 def _read_key(prompt: str, valid: str = "arsq") -> str:
     """Read a single valid key from stdin.
 
+    On an interactive terminal the decision is a single keystroke; when
+    stdin is piped (scripts, tests) a line is read and its first character
+    used.
+
     Args:
         prompt: Prompt text to display
         valid: String of valid key characters
@@ -26,12 +83,21 @@ def _read_key(prompt: str, valid: str = "arsq") -> str:
         The key pressed (lowercase)
     """
     console.print(prompt, end="")
+    single_key = sys.stdin.isatty() and (_TERMIOS_AVAILABLE or _MSVCRT_AVAILABLE)
     while True:
         try:
-            line = input().strip().lower()
+            if single_key:
+                line = _getch().lower()
+                # EOF, Ctrl-D, or Ctrl-C delivered as a character
+                if line in ("", "\x04", "\x03"):
+                    return "q"
+            else:
+                line = input().strip().lower()
         except (EOFError, KeyboardInterrupt):
             return "q"
         if line and line[0] in valid:
+            if single_key:
+                console.print(line[0])  # cbreak mode doesn't echo
             return line[0]
         console.print(f"  [dim]Press one of: {', '.join(valid)}[/dim] ", end="")
 
@@ -57,11 +123,15 @@ def review_merges(merge_file: MergeFile, auto_approve_threshold: float = 0.85) -
         return {"auto_approved": 0, "approved": 0, "rejected": 0, "skipped": 0}
 
     # Auto-approve high-confidence proposals
+    # The member scan stops at the first one below threshold, and is
+    # skipped entirely when auto-approve is disabled.
+    auto_enabled = auto_approve_threshold < 1.0
     auto_approved = []
     manual_review = []
     for proposal in drafts:
-        min_conf = min(m.confidence for m in proposal.members)
-        if auto_approve_threshold < 1.0 and min_conf >= auto_approve_threshold:
+        if auto_enabled and all(
+            m.confidence >= auto_approve_threshold for m in proposal.members
+        ):
             proposal.status = "CONFIRMED"
             auto_approved.append(proposal)
         else:
@@ -82,9 +152,10 @@ def review_merges(merge_file: MergeFile, auto_approve_threshold: float = 0.85) -
         return stats
 
     total = len(manual_review)
-    console.print(f"[bold cyan]Entity Merge Review[/bold cyan]  —  {total} proposals to review")
-    console.print("[dim]For each proposal, decide whether these entities are the same.[/dim]")
-    console.print()
+    console.print(
+        f"[bold cyan]Entity Merge Review[/bold cyan]  —  {total} proposals to review\n"
+        "[dim]For each proposal, decide whether these entities are the same.[/dim]\n"
+    )
 
     for i, proposal in enumerate(manual_review):
         # Build the panel content
@@ -105,7 +176,7 @@ def review_merges(merge_file: MergeFile, auto_approve_threshold: float = 0.85) -
         member_table.add_column("Confidence", justify="right")
 
         for member in proposal.members:
-            conf_style = "green" if member.confidence >= 0.8 else "yellow" if member.confidence >= 0.5 else "red"
+            conf_style = _conf_style(member.confidence)
             member_table.add_row(
                 member.name,
                 member.id,
@@ -113,10 +184,9 @@ def review_merges(merge_file: MergeFile, auto_approve_threshold: float = 0.85) -
             )
 
         # Build panel body: header + table + reason
-        from rich.console import Group
-        parts = [header, Text(""), member_table]
+        parts = [header, _SPACER, member_table]
         if proposal.reason:
-            parts.append(Text(""))
+            parts.append(_SPACER)
             reason_text = Text()
             reason_text.append("Reason: ", style="bold")
             reason_text.append(proposal.reason, style="dim")
@@ -131,26 +201,25 @@ def review_merges(merge_file: MergeFile, auto_approve_threshold: float = 0.85) -
         console.print(panel)
 
         # Get user decision
-        choice = _read_key(r"  \[a]pprove  \[r]eject  \[s]kip  \[q]uit → ")
-        console.print()
+        choice = _read_key(_DECISION_PROMPT)
 
+        if choice == "q":
+            stats["skipped"] += total - i
+            console.print(
+                f"\n  [dim]Quit — skipping remaining {total - i} proposals[/dim]",
+                highlight=False,
+            )
+            break
         if choice == "a":
             proposal.status = "CONFIRMED"
             stats["approved"] += 1
-            console.print("  [green]✓ Approved[/green]")
         elif choice == "r":
             proposal.status = "REJECTED"
             stats["rejected"] += 1
-            console.print("  [red]✗ Rejected[/red]")
-        elif choice == "s":
+        else:
             stats["skipped"] += 1
-            console.print("  [dim]⏭ Skipped[/dim]")
-        elif choice == "q":
-            stats["skipped"] += total - i
-            console.print(f"  [dim]Quit — skipping remaining {total - i} proposals[/dim]")
-            break
-
-        console.print()
+        # Blank line, outcome, blank line — one write instead of three
+        console.print(_OUTCOME_LINES[choice], highlight=False)
 
     # Summary
     console.print(
@@ -187,41 +256,42 @@ def review_relations(
         console.print("[dim]No flagged relations to review.[/dim]")
         return {"approved": 0, "rejected": 0, "skipped": 0}
 
-    # Auto-approve high-confidence relations
+    # Classify every draft in one pass: auto-approve wins over auto-reject,
+    # everything else goes to manual review.
+    approve_enabled = auto_approve_threshold < 1.0
+    reject_enabled = auto_reject_threshold > 0.0
     auto_approved = 0
-    if auto_approve_threshold < 1.0:
-        for entry in drafts:
-            if entry.confidence >= auto_approve_threshold:
-                entry.status = "CONFIRMED"
-                auto_approved += 1
-        if auto_approved:
-            console.print(
-                f"[green]Auto-approved {auto_approved} relations "
-                f"(confidence ≥ {auto_approve_threshold:.0%})[/green]"
-            )
-
-    # Auto-reject low-confidence relations
     auto_rejected = 0
-    if auto_reject_threshold > 0.0:
-        for entry in review_file.draft:
-            if entry.confidence <= auto_reject_threshold:
-                entry.status = "REJECTED"
-                auto_rejected += 1
-        if auto_rejected:
-            console.print(
-                f"[red]Auto-rejected {auto_rejected} relations "
-                f"(confidence < {auto_reject_threshold:.0%})[/red]"
-            )
+    manual_review = []
+    for entry in drafts:
+        if approve_enabled and entry.confidence >= auto_approve_threshold:
+            entry.status = "CONFIRMED"
+            auto_approved += 1
+        elif reject_enabled and entry.confidence <= auto_reject_threshold:
+            entry.status = "REJECTED"
+            auto_rejected += 1
+        else:
+            manual_review.append(entry)
 
-    # Re-check drafts after auto-approve/reject
-    drafts = review_file.draft
+    if auto_approved:
+        console.print(
+            f"[green]Auto-approved {auto_approved} relations "
+            f"(confidence ≥ {auto_approve_threshold:.0%})[/green]"
+        )
+    if auto_rejected:
+        console.print(
+            f"[red]Auto-rejected {auto_rejected} relations "
+            f"(confidence < {auto_reject_threshold:.0%})[/red]"
+        )
+
+    drafts = manual_review
     total = len(drafts)
     stats = {"approved": auto_approved, "rejected": auto_rejected, "skipped": 0}
 
-    console.print()
-    console.print(f"[bold cyan]Relation Review[/bold cyan]  —  {total} flagged relations to review")
-    console.print("[dim]For each relation, decide whether it's valid.[/dim]")
-    console.print()
+    console.print(
+        f"\n[bold cyan]Relation Review[/bold cyan]  —  {total} flagged relations to review\n"
+        "[dim]For each relation, decide whether it's valid.[/dim]\n"
+    )
 
     for i, entry in enumerate(drafts):
         # Build relation display
@@ -230,7 +300,7 @@ def review_relations(
         content.append(f"  —[{entry.relation_type}]→  ", style="bold cyan")
         content.append(f"{entry.target_name}", style="green")
 
-        conf_style = "green" if entry.confidence >= 0.8 else "yellow" if entry.confidence >= 0.5 else "red"
+        conf_style = _conf_style(entry.confidence)
         subtitle_parts = []
         if entry.flag_reason:
             subtitle_parts.append(entry.flag_reason)
@@ -245,32 +315,31 @@ def review_relations(
             border_style=conf_style,
             padding=(1, 2),
         )
-        console.print(panel)
-
         if entry.evidence:
-            console.print(f"  [dim]Evidence: {entry.evidence}[/dim]")
+            console.print(Group(panel, Text(f"  Evidence: {entry.evidence}", style="dim")))
+        else:
+            console.print(panel)
 
         # Get user decision
-        choice = _read_key(r"  \[a]pprove  \[r]eject  \[s]kip  \[q]uit → ")
-        console.print()
+        choice = _read_key(_DECISION_PROMPT)
 
+        if choice == "q":
+            stats["skipped"] += total - i
+            console.print(
+                f"\n  [dim]Quit — skipping remaining {total - i} relations[/dim]",
+                highlight=False,
+            )
+            break
         if choice == "a":
             entry.status = "CONFIRMED"
             stats["approved"] += 1
-            console.print("  [green]✓ Approved[/green]")
         elif choice == "r":
             entry.status = "REJECTED"
             stats["rejected"] += 1
-            console.print("  [red]✗ Rejected[/red]")
-        elif choice == "s":
+        else:
             stats["skipped"] += 1
-            console.print("  [dim]⏭ Skipped[/dim]")
-        elif choice == "q":
-            stats["skipped"] += total - i
-            console.print(f"  [dim]Quit — skipping remaining {total - i} relations[/dim]")
-            break
-
-        console.print()
+        # Blank line, outcome, blank line — one write instead of three
+        console.print(_OUTCOME_LINES[choice], highlight=False)
 
     # Summary
     console.print(
@@ -0,0 +1,28 @@
+"""Array-backed union-find shared by the resolve grouping passes.
+
+Entities are addressed by their index in a list; ``parent`` starts as
+``list(range(n))`` and is updated in place.
+"""
+
+
+def find(parent: list[int], i: int) -> int:
+    """Return the root of i, halving the path on the way up."""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def union(parent: list[int], a: int, b: int) -> None:
+    """Join the sets of a and b under the lower root index."""
+    ra, rb = find(parent, a), find(parent, b)
+    if ra != rb:
+        parent[max(ra, rb)] = min(ra, rb)
+
+
+def components(parent: list[int], entities: list[dict]) -> list[list[dict]]:
+    """Collect union-find components with two or more members."""
+    groups: dict[int, list[dict]] = {}
+    for i, entity in enumerate(entities):
+        groups.setdefault(find(parent, i), []).append(entity)
+    return [g for g in groups.values() if len(g) >= 2]
@@ -1,6 +1,58 @@
 var allNodes = nodes.get();
 var allEdges = edges.get();
 
+// relation_type -> [edge, ...], so relation toggles touch only their own edges
+var edgesByRelType = {};
+// node id -> [incident edge, ...] in allEdges order, so neighbor lookups cost
+// O(degree) instead of a scan of every edge
+var edgesByNode = {};
+allEdges.forEach(function(e) {
+    (edgesByRelType[e.relation_type] || (edgesByRelType[e.relation_type] = [])).push(e);
+    (edgesByNode[e.from] || (edgesByNode[e.from] = [])).push(e);
+    if (e.to !== e.from) (edgesByNode[e.to] || (edgesByNode[e.to] = [])).push(e);
+});
+
+function incidentEdges(nodeId) {
+    return edgesByNode[nodeId] || [];
+}
+
+// node id -> global degree, for ranking neighbors without scanning allNodes
+// inside every sort comparison
+var degreeById = {};
+allNodes.forEach(function(n) { degreeById[n.id] = n.node_degree || 0; });
+
+function byDegreeDesc(a, b) {
+    return (degreeById[b] || 0) - (degreeById[a] || 0);
+}
+
+// node id -> distinct neighbor ids, highest global degree first. Built on
+// first use and reused, so revisiting a node or stepping through its
+// connections takes the top K without sorting again.
+var rankedNeighborCache = {};
+
+function rankedNeighbors(nodeId) {
+    var ranked = rankedNeighborCache[nodeId];
+    if (ranked) return ranked;
+    ranked = [];
+    var seen = new Set();
+    incidentEdges(nodeId).forEach(function(e) {
+        var other = e.from === nodeId ? e.to : e.from;
+        if (!seen.has(other)) {
+            seen.add(other);
+            ranked.push(other);
+        }
+    });
+    ranked.sort(byDegreeDesc);
+    rankedNeighborCache[nodeId] = ranked;
+    return ranked;
+}
+
+// Direction-independent key for a node pair (ids are strings; compared the
+// way Array.sort would order them, without allocating an array)
+function pairKey(a, b) {
+    return a < b ? a + '||' + b : b + '||' + a;
+}
+
 // --- Community region data ---
 var communityHulls = {};   // comm -> [{x,y}, ...] padded convex hull points
 var communityCentroids = {}; // comm -> {x, y}
@@ -146,16 +198,48 @@ var db = document.getElementById('detail-body');
 var detailBackBtn = document.getElementById('detail-back');
 var detailLastNodeId = null;
 
+// Canvas size for camera framing. Reading clientWidth/Height forces a
+// layout, so it is read once and again only after the window resizes.
+var canvasSize = null;
+window.addEventListener('resize', function() { canvasSize = null; });
+
+function getCanvasSize() {
+    if (!canvasSize) {
+        var canvasEl = network.canvas.frame.canvas;
+        canvasSize = { w: canvasEl.clientWidth, h: canvasEl.clientHeight };
+    }
+    return canvasSize;
+}
+
+// HTML-escape for text and quoted attribute values. A string replace
+// rather than a scratch element's innerHTML: no DOM node per call, and
+// quotes are escaped too.
+var ESC_CHARS = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+function escChar(ch) { return ESC_CHARS[ch]; }
 function esc(s) {
-    var d = document.createElement('div');
-    d.textContent = String(s);
-    return d.innerHTML;
+    return String(s).replace(/[&<>"']/g, escChar);
+}
+
+// Detail-panel rows from the node's structured fields (type, degree,
+// confidence, first sources, leading attributes)
+function nodeFieldsHtml(node) {
+    var rows = [['Type', node.entity_type || 'UNKNOWN'], ['Connections', node.node_degree || 0]];
+    if (typeof node.confidence === 'number') rows.push(['Confidence', Math.round(node.confidence * 100) + '%']);
+    if (node.source_docs_str) rows.push(['Sources', node.source_docs_str.split(',').slice(0, 3).join(', ')]);
+    (node.top_attributes || []).forEach(function(kv) { rows.push(kv); });
+    var h = '';
+    rows.forEach(function(r) {
+        if (r[1] === '') return;
+        h += '<div class="d-field"><div class="d-label">' + esc(r[0]) + '</div>';
+        h += '<div class="d-val">' + esc(r[1]) + '</div></div>';
+    });
+    return h;
 }
 
 // --- Trail breadcrumb helpers ---
 function findRelationBetween(fromId, toId) {
     var outgoing = [], incoming = [];
-    allEdges.forEach(function(e) {
+    incidentEdges(fromId).forEach(function(e) {
         if (e.from === fromId && e.to === toId) {
             if (outgoing.indexOf(e.relation_type) < 0) outgoing.push(e.relation_type);
         } else if (e.to === fromId && e.from === toId) {
@@ -193,7 +277,7 @@ function getTrailEdgeIds() {
     for (var i = 0; i < trail.length - 1; i++) {
         var fromId = trail[i].nodeId;
         var toId = trail[i + 1].nodeId;
-        allEdges.forEach(function(e) {
+        incidentEdges(fromId).forEach(function(e) {
             if ((e.from === fromId && e.to === toId) || (e.to === fromId && e.from === toId)) {
                 edgeIds.add(e.id);
             }
@@ -209,7 +293,7 @@ function getTrailEdgePerspectives() {
     for (var i = 0; i < trail.length - 1; i++) {
         var fromId = trail[i].nodeId;
         var toId = trail[i + 1].nodeId;
-        allEdges.forEach(function(e) {
+        incidentEdges(fromId).forEach(function(e) {
             if ((e.from === fromId && e.to === toId) || (e.to === fromId && e.from === toId)) {
                 map[e.id] = fromId;
             }
@@ -223,7 +307,7 @@ function buildNodeDetailHtml(nodeId) {
     if (!node) return '';
 
     var connMap = {};
-    allEdges.forEach(function(e) {
+    incidentEdges(nodeId).forEach(function(e) {
         var dir, nid, name;
         if (e.from === nodeId) { dir = '\u2192'; nid = e.to; name = e.target_name || e.to; }
         else if (e.to === nodeId) { dir = '\u2190'; nid = e.from; name = e.source_name || e.from; }
@@ -271,17 +355,7 @@ function buildNodeDetailHtml(nodeId) {
         h += '<div class="d-evidence">' + esc(node.description) + '</div></div>';
     }
 
-    var lines = (node.title || '').split('\n');
-    for (var i = 1; i < lines.length; i++) {
-        var ln = lines[i].trim();
-        if (!ln) continue;
-        if (ln.startsWith('Community:')) continue;
-        var ci = ln.indexOf(': ');
-        if (ci > 0) {
-            h += '<div class="d-field"><div class="d-label">' + esc(ln.substring(0, ci)) + '</div>';
-            h += '<div class="d-val">' + esc(ln.substring(ci + 2)) + '</div></div>';
-        }
-    }
+    h += nodeFieldsHtml(node);
 
     var relTypes = [];
     var seenRel = {};
@@ -314,7 +388,10 @@ function buildNodeDetailHtml(nodeId) {
     return h;
 }
 
+// Row markup is cached on the connection object, so switching the relation
+// filter re-joins existing rows instead of rebuilding and re-escaping them
 function buildConnRowHtml(c) {
+    if (c.rowHtml) return c.rowHtml;
     var isIncoming = c.dir === '\u2190';
     var relLabel = c.rels.map(function(r){ return isIncoming ? inverseRelLabel(r) : formatRelLabel(r); }).join(', ');
     var h = '';
@@ -344,6 +421,7 @@ function buildConnRowHtml(c) {
     }
     h += '</div>';
     h += '</div>';
+    c.rowHtml = h;
     return h;
 }
 
@@ -512,7 +590,7 @@ function showNodeDetail(nodeId) {
 
     // gather connections — group by neighbor, merge relation types, store edge data
     var connMap = {};
-    allEdges.forEach(function(e) {
+    incidentEdges(nodeId).forEach(function(e) {
         var dir, nid, name;
         if (e.from === nodeId) { dir = '\u2192'; nid = e.to; name = e.target_name || e.to; }
         else if (e.to === nodeId) { dir = '\u2190'; nid = e.from; name = e.source_name || e.from; }
@@ -564,18 +642,8 @@ function showNodeDetail(nodeId) {
         h += '<div class="d-evidence">' + esc(node.description) + '</div></div>';
     }
 
-    // parse tooltip fields
-    var lines = (node.title || '').split('\n');
-    for (var i = 1; i < lines.length; i++) {
-        var ln = lines[i].trim();
-        if (!ln) continue;
-        if (ln.startsWith('Community:')) continue;
-        var ci = ln.indexOf(': ');
-        if (ci > 0) {
-            h += '<div class="d-field"><div class="d-label">' + esc(ln.substring(0, ci)) + '</div>';
-            h += '<div class="d-val">' + esc(ln.substring(ci + 2)) + '</div></div>';
-        }
-    }
+    // summary fields
+    h += nodeFieldsHtml(node);
 
     // unique relation types for filter (flatten from grouped rels)
     var relTypes = [];
@@ -651,16 +719,14 @@ function showEdgeDetail(edgeId) {
 // --- Entity type toggle ---
 function toggleEntityType(cb) {
     var type = cb.dataset.etype;
-    if (cb.checked) hiddenEntityTypes.delete(type);
-    else hiddenEntityTypes.add(type);
+    setEntityTypeHidden(type, !cb.checked);
     applyFilters();
 }
 
 // --- Community toggle ---
 function toggleCommunity(cb) {
     var comm = cb.dataset.community;
-    if (cb.checked) hiddenCommunities.delete(comm);
-    else hiddenCommunities.add(comm);
+    setCommunityHidden(comm, !cb.checked);
     applyFilters();
 }
 
@@ -669,7 +735,11 @@ function toggleRelationType(cb) {
     var type = cb.dataset.rtype;
     if (cb.checked) hiddenRelationTypes.delete(type);
     else hiddenRelationTypes.add(type);
-    applyEdgeFilters();
+    var updates = [];
+    pushEdgeVisibility(edgesByRelType[type] || [], hiddenRelationTypes.has(type), updates);
+    edges.update(updates);
+    edgeFocusHiddenKnown = false;
+    focusShownEdges = null;
 }
 
 // --- Entity color picker ---
@@ -688,37 +758,104 @@ function changeEntityColor(input) {
     allNodes = nodes.get();
 }
 
+// Per-node columns for the applyFilters loop, by allNodes index. Entity
+// types and communities are interned to small integers so a pass checks
+// typed arrays instead of hashing strings and reading object properties.
+// Node order in the DataSet never changes, so these stay valid when
+// changeEntityColor refreshes allNodes.
+function internIndex(dict, list, value) {
+    var idx = dict[value];
+    if (idx === undefined) {
+        idx = list.length;
+        dict[value] = idx;
+        list.push(value);
+    }
+    return idx;
+}
+
+var entityTypeIdx = {}, entityTypeNames = [];
+var communityIdx = {}, communityNames = [];
+var nodeDegree = new Int32Array(allNodes.length);
+var nodeDocCount = new Int32Array(allNodes.length);
+var nodeEntityType = new Uint16Array(allNodes.length);
+var nodeCommunity = new Int32Array(allNodes.length);  // -1 = none
+allNodes.forEach(function(n, i) {
+    nodeDegree[i] = n.node_degree || 0;
+    nodeDocCount[i] = n.num_source_docs || 0;
+    nodeEntityType[i] = internIndex(entityTypeIdx, entityTypeNames, n.entity_type);
+    nodeCommunity[i] = n.community ? internIndex(communityIdx, communityNames, n.community) : -1;
+});
+
+// Hidden flag per interned entity type / community, kept in step with the
+// hidden Sets so applyFilters screens nodes with array reads alone.
+// Community index -1 (no community) never reads these.
+var entityTypeHiddenBits = new Uint8Array(entityTypeNames.length);
+var communityHiddenBits = new Uint8Array(communityNames.length);
+
+function setEntityTypeHidden(type, hidden) {
+    if (hidden) hiddenEntityTypes.add(type);
+    else hiddenEntityTypes.delete(type);
+    var idx = entityTypeIdx[type];
+    if (idx !== undefined) entityTypeHiddenBits[idx] = hidden ? 1 : 0;
+}
+
+function setCommunityHidden(comm, hidden) {
+    if (hidden) hiddenCommunities.add(comm);
+    else hiddenCommunities.delete(comm);
+    var idx = communityIdx[comm];
+    if (idx !== undefined) communityHiddenBits[idx] = hidden ? 1 : 0;
+}
+
+// Hidden state applyFilters last pushed, by allNodes index. Focus mode
+// writes node visibility directly and clears nodeHiddenKnown, making the
+// next pass push every node instead of only the ones that changed.
+var nodeHiddenState = new Uint8Array(allNodes.length);
+var nodeHiddenKnown = true;
+
 function applyFilters() {
     var updates = [];
-    allNodes.forEach(function(node) {
-        var docHidden = false;
-        if (activeSourceDoc) {
-            var nodeDocs = (node.source_docs_str || '').split(',');
-            docHidden = nodeDocs.indexOf(activeSourceDoc) < 0;
+    var pushAll = !nodeHiddenKnown;
+    var n = allNodes.length;
+    for (var i = 0; i < n; i++) {
+        var comm = nodeCommunity[i];
+        var state = entityTypeHiddenBits[nodeEntityType[i]] |
+                    (comm >= 0 ? communityHiddenBits[comm] : 0) |
+                    (nodeDegree[i] < minDegree ? 1 : 0) |
+                    (nodeDocCount[i] < minSupportDocs ? 1 : 0);
+        if (!state && activeSourceDoc) {
+            var nodeDocs = (allNodes[i].source_docs_str || '').split(',');
+            if (nodeDocs.indexOf(activeSourceDoc) < 0) state = 1;
         }
-        var hidden = hiddenEntityTypes.has(node.entity_type) ||
-                     (node.community && hiddenCommunities.has(node.community)) ||
-                     (node.node_degree || 0) < minDegree ||
-                     (node.num_source_docs || 0) < minSupportDocs ||
-                     docHidden;
-        updates.push({ id: node.id, hidden: hidden });
-    });
-    nodes.update(updates);
+        if (pushAll || nodeHiddenState[i] !== state) {
+            nodeHiddenState[i] = state;
+            updates.push({ id: allNodes[i].id, hidden: state === 1 });
+        }
+    }
+    nodeHiddenKnown = true;
+    if (updates.length) nodes.update(updates);
 }
 
-function applyEdgeFilters() {
-    var updates = [];
-    allEdges.forEach(function(edge) {
-        var docHidden = false;
-        if (activeSourceDoc) {
+// Queue hidden-state updates for one relation type's edges; the source
+// document filter only needs checking when the type itself is shown
+function pushEdgeVisibility(bucket, typeHidden, updates) {
+    bucket.forEach(function(edge) {
+        var hidden = typeHidden;
+        if (!hidden && activeSourceDoc) {
             var edgeDocs = (edge.support_docs_str || '').split(',');
-            docHidden = edgeDocs.indexOf(activeSourceDoc) < 0;
+            hidden = edgeDocs.indexOf(activeSourceDoc) < 0;
         }
-        var hidden = hiddenRelationTypes.has(edge.relation_type) ||
-                     docHidden;
         updates.push({ id: edge.id, hidden: hidden });
     });
+}
+
+function applyEdgeFilters() {
+    var updates = [];
+    for (var rt in edgesByRelType) {
+        pushEdgeVisibility(edgesByRelType[rt], hiddenRelationTypes.has(rt), updates);
+    }
     edges.update(updates);
+    edgeFocusHiddenKnown = false;
+    focusShownEdges = null;
 }
 
 // --- Degree filter ---
@@ -760,7 +897,7 @@ function filterBySourceDoc(val) {
         document.querySelectorAll('[data-community]').forEach(function(cb) {
             if (cb.dataset.community !== target) {
                 cb.checked = false;
-                hiddenCommunities.add(cb.dataset.community);
+                setCommunityHidden(cb.dataset.community, true);
             }
         });
     }
@@ -779,12 +916,37 @@ function filterBySourceDoc(val) {
 })();
 
 // --- Search ---
+// Typing fires oninput per keystroke; only the query left after a short
+// pause is run, so a burst of keys costs one pass over the graph.
+var SEARCH_DEBOUNCE_MS = 120;
+var searchTimer = null;
+// Whether match highlighting is on screen, so clearing an already-clear
+// field doesn't push a reset for every node
+var searchHighlightActive = false;
+// Search class runSearch last pushed, by allNodes index (0 plain, 1 match,
+// 2 neighbor, 3 dimmed); only nodes whose class changes are updated. Hover
+// and focus mode restyle nodes directly and clear searchStateKnown.
+var searchState = new Uint8Array(allNodes.length);
+var searchStateKnown = true;
+
 function searchEntity(query) {
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(function() { runSearch(query); }, SEARCH_DEBOUNCE_MS);
+}
+
+function runSearch(query) {
+    var pushAll = !searchStateKnown;
+    searchStateKnown = true;
     if (!query || query.length < 2) {
-        var reset = allNodes.map(function(n) {
-            return { id: n.id, opacity: 1.0, font: { size: 0 }, borderWidth: n.community ? 2 : 1.5 };
+        if (!searchHighlightActive) return;
+        var reset = [];
+        allNodes.forEach(function(n, i) {
+            if (!pushAll && searchState[i] === 0) return;
+            searchState[i] = 0;
+            reset.push({ id: n.id, opacity: 1.0, font: { size: 0 }, borderWidth: n.community ? 2 : 1.5 });
         });
-        nodes.update(reset);
+        if (reset.length) nodes.update(reset);
+        searchHighlightActive = false;
         return;
     }
     query = query.toLowerCase();
@@ -795,27 +957,40 @@ function searchEntity(query) {
         if (name.includes(query) || als.includes(query)) matchIds.add(n.id);
     });
     var neighborIds = new Set();
-    allEdges.forEach(function(e) {
-        if (matchIds.has(e.from)) neighborIds.add(e.to);
-        if (matchIds.has(e.to)) neighborIds.add(e.from);
+    matchIds.forEach(function(id) {
+        incidentEdges(id).forEach(function(e) {
+            if (matchIds.has(e.from)) neighborIds.add(e.to);
+            if (matchIds.has(e.to)) neighborIds.add(e.from);
+        });
     });
-    var updates = allNodes.map(function(n) {
-        if (matchIds.has(n.id))
-            return { id: n.id, opacity: 1.0, font: { size: 18, color: '#ffffff' }, borderWidth: 3 };
-        else if (neighborIds.has(n.id))
-            return { id: n.id, opacity: 0.8, font: { size: 12 }, borderWidth: n.community ? 2 : 1.5 };
+    var updates = [];
+    allNodes.forEach(function(n, i) {
+        var cls = matchIds.has(n.id) ? 1 : neighborIds.has(n.id) ? 2 : 3;
+        if (!pushAll && searchState[i] === cls) return;
+        searchState[i] = cls;
+        if (cls === 1)
+            updates.push({ id: n.id, opacity: 1.0, font: { size: 18, color: '#ffffff' }, borderWidth: 3 });
+        else if (cls === 2)
+            updates.push({ id: n.id, opacity: 0.8, font: { size: 12 }, borderWidth: n.community ? 2 : 1.5 });
         else
-            return { id: n.id, opacity: 0.1, font: { size: 0 }, borderWidth: 1 };
+            updates.push({ id: n.id, opacity: 0.1, font: { size: 0 }, borderWidth: 1 });
     });
-    nodes.update(updates);
+    if (updates.length) nodes.update(updates);
+    searchHighlightActive = true;
     if (matchIds.size > 0) {
         network.focus(matchIds.values().next().value, { scale: 1.5, animation: { duration: 500 } });
     }
 }
 
 // --- Focus mode (ego-graph explorer) ---
+// Relation types are a small fixed set; labels are computed once per type
+var relLabelCache = Object.create(null);
+var inverseRelLabelCache = Object.create(null);
+
 function formatRelLabel(rt) {
-    return rt.toLowerCase().replace(/_/g, ' ');
+    var label = relLabelCache[rt];
+    if (label === undefined) label = relLabelCache[rt] = rt.toLowerCase().replace(/_/g, ' ');
+    return label;
 }
 
 // Direction-aware edge label relative to a perspective node
@@ -828,17 +1003,22 @@ function edgeLabelFrom(e, perspectiveNodeId) {
 
 // Convert relation type to passive/inverse form for incoming edges
 // e.g. "CONTRADICTS" → "CONTRADICTED BY", "GOVERNS" → "GOVERNED BY"
+var INVERSE_REL_LABELS = {
+    'CONTRADICTS': 'CONTRADICTED BY',
+    'GOVERNS': 'GOVERNED BY',
+    'INVOLVES': 'INVOLVED IN',
+    'RESPONSIBLE_FOR': 'UNDER RESPONSIBILITY OF',
+    'ENABLED_BY': 'ENABLES',
+    'ASSOCIATED_WITH': 'ASSOCIATED WITH'
+};
 function inverseRelLabel(rt) {
-    var inv = {
-        'CONTRADICTS': 'CONTRADICTED BY',
-        'GOVERNS': 'GOVERNED BY',
-        'INVOLVES': 'INVOLVED IN',
-        'RESPONSIBLE_FOR': 'UNDER RESPONSIBILITY OF',
-        'ENABLED_BY': 'ENABLES',
-        'ASSOCIATED_WITH': 'ASSOCIATED WITH'
-    };
+    var label = inverseRelLabelCache[rt];
+    if (label === undefined) label = inverseRelLabelCache[rt] = computeInverseRelLabel(rt);
+    return label;
+}
+function computeInverseRelLabel(rt) {
     var upper = rt.toUpperCase().replace(/\s+/g, '_');
-    if (inv[upper]) return formatRelLabel(inv[upper]);
+    if (INVERSE_REL_LABELS[upper]) return formatRelLabel(INVERSE_REL_LABELS[upper]);
     // Fallback: try common English verb patterns
     var lower = rt.toLowerCase().replace(/_/g, ' ');
     if (lower.endsWith('s') && !lower.endsWith('ss')) {
@@ -857,14 +1037,25 @@ network.on('doubleClick', function(params) {
     }
 });
 
+// Connection rows of the current detail view, looked up once per rebuild.
+// Every rebuild replaces the list's innerHTML, detaching the old rows, so a
+// disconnected first row means the cache is stale.
+var connRowsCache = [];
+function getConnRows() {
+    if (!connRowsCache.length || !connRowsCache[0].isConnected) {
+        var connList = document.querySelector('.trail-card.current .trail-conn-list') || document.getElementById('conn-list');
+        connRowsCache = connList ? Array.from(connList.querySelectorAll('.d-conn')) : [];
+    }
+    return connRowsCache;
+}
+
 document.addEventListener('keydown', function(ev) {
     if (ev.key === 'Escape') {
         exitFocusMode();
         return;
     }
     if (focusedNodeId === null) return;
-    var connList = document.querySelector('.trail-card.current .trail-conn-list') || document.getElementById('conn-list');
-    var rows = connList ? connList.querySelectorAll('.d-conn') : [];
+    var rows = getConnRows();
     if (!rows.length) return;
 
     if (ev.key === 'ArrowDown' || ev.key === 'ArrowUp') {
@@ -920,9 +1111,27 @@ document.addEventListener('keydown', function(ev) {
     }
 });
 
+// Holding an arrow key calls highlightConn faster than the camera can
+// animate; only the latest index is drawn, once per animation frame.
+var pendingConnIdx = -1;
+var connFrame = 0;
+
 function highlightConn(idx) {
-    var connList = document.querySelector('.trail-card.current .trail-conn-list') || document.getElementById('conn-list');
-    var rows = connList ? connList.querySelectorAll('.d-conn') : [];
+    pendingConnIdx = idx;
+    if (connFrame) return;
+    connFrame = requestAnimationFrame(function() {
+        connFrame = 0;
+        if (focusedNodeId !== null) drawConnHighlight(pendingConnIdx);
+    });
+}
+
+function cancelConnHighlight() {
+    if (connFrame) cancelAnimationFrame(connFrame);
+    connFrame = 0;
+}
+
+function drawConnHighlight(idx) {
+    var rows = getConnRows();
     rows.forEach(function(r, i) {
         r.classList.toggle('active', i === idx);
         if (i !== idx) r.classList.remove('expanded');
@@ -934,91 +1143,36 @@ function highlightConn(idx) {
     network.selectNodes([c.nid]);
 
     // Find neighbor's adjacents, ranked by degree — cap at 10
-    var adjList = [];
-    var adjDeg = {};
-    allEdges.forEach(function(e) {
-        var other = null;
-        if (e.from === c.nid && e.to !== focusedNodeId) other = e.to;
-        if (e.to === c.nid && e.from !== focusedNodeId) other = e.from;
-        if (other && !adjDeg[other]) {
-            adjDeg[other] = 0;
-            adjList.push(other);
-        }
-        if (other) adjDeg[other]++;
-    });
-    adjList.sort(function(a, b) {
-        var da = 0, db = 0;
-        allNodes.forEach(function(n) {
-            if (n.id === a) da = n.node_degree || 0;
-            if (n.id === b) db = n.node_degree || 0;
-        });
-        return db - da;
-    });
     var MAX_ADJ = 10;
-    var adjIds = new Set(adjList.slice(0, MAX_ADJ));
+    var adjIds = new Set();
+    var adjRanked = rankedNeighbors(c.nid);
+    for (var k = 0; k < adjRanked.length && adjIds.size < MAX_ADJ; k++) {
+        if (adjRanked[k] !== focusedNodeId) adjIds.add(adjRanked[k]);
+    }
 
     // Collect focused node's 1-hop neighbors so they stay faintly visible
     var focusNeighborIds = new Set();
-    allEdges.forEach(function(e) {
+    incidentEdges(focusedNodeId).forEach(function(e) {
         if (e.from === focusedNodeId && e.to !== c.nid) focusNeighborIds.add(e.to);
         if (e.to === focusedNodeId && e.from !== c.nid) focusNeighborIds.add(e.from);
     });
 
-    // Nodes: primary pair full, trail visible, adjacents ghosted, focus neighbors faint
     var trailNids = getTrailNodeIds();
-    var nodeUpdates = [];
-    allNodes.forEach(function(n) {
-        var isPrimary = n.id === focusedNodeId || n.id === c.nid;
-        var isAdj = adjIds.has(n.id);
-        var isTrail = trailNids.has(n.id);
-        var isFocusNeighbor = focusNeighborIds.has(n.id);
-        var visible = isPrimary || isAdj || isTrail || isFocusNeighbor;
-        var opacity = isPrimary || isTrail ? 1.0 : isAdj ? 0.35 : isFocusNeighbor ? 0.15 : 1.0;
-        nodeUpdates.push({ id: n.id, hidden: !visible, opacity: opacity });
-    });
-    nodes.update(nodeUpdates);
 
     // Count parallel edges between primary pair for curve offsets
     var primaryCount = 0;
-    var primaryIndex = {};
-    allEdges.forEach(function(e) {
+    var primaryIndex = new Map();
+    incidentEdges(c.nid).forEach(function(e) {
         var isPrimary = (e.from === focusedNodeId && e.to === c.nid) || (e.to === focusedNodeId && e.from === c.nid);
         if (isPrimary) {
-            primaryIndex[e.id] = primaryCount;
+            primaryIndex.set(e, primaryCount);
             primaryCount++;
         }
     });
 
-    // Edges: primary thick + labeled, trail visible + labeled, adjacent thin, focus-neighbor faint
-    var trailEids = getTrailEdgeIds();
-    var trailPersp = getTrailEdgePerspectives();
-    var edgeUpdates = [];
-    allEdges.forEach(function(e) {
-        var isPrimary = (e.from === focusedNodeId && e.to === c.nid) || (e.to === focusedNodeId && e.from === c.nid);
-        var isAdj = (e.from === c.nid && adjIds.has(e.to)) || (e.to === c.nid && adjIds.has(e.from));
-        var isTrail = trailEids.has(e.id);
-        var isFocusEdge = (e.from === focusedNodeId && focusNeighborIds.has(e.to)) || (e.to === focusedNodeId && focusNeighborIds.has(e.from));
-        var show = (isPrimary || isAdj || isTrail || isFocusEdge) && !hiddenRelationTypes.has(e.relation_type);
-        var origWidth = Math.min(10, 1.5 + (e.support_count || 1) * 2);
-        var origColor = (typeof e.color === 'string') ? e.color : (e.color && e.color.color) || '#888';
-        var edgeOpacity = isPrimary || isTrail ? 1.0 : isAdj ? 0.25 : isFocusEdge ? 0.1 : 0.25;
-        var edgePerspective = isTrail ? (trailPersp[e.id] || focusedNodeId) : focusedNodeId;
-        var update = {
-            id: e.id,
-            hidden: !show,
-            color: { color: origColor, opacity: edgeOpacity },
-            label: (isPrimary || isTrail) ? edgeLabelFrom(e, edgePerspective) : '',
-            width: isPrimary ? Math.max(3, origWidth) : (isTrail ? origWidth : 1)
-        };
-        if (isPrimary && primaryCount > 1) {
-            var roundness = 0.15 + (primaryIndex[e.id] || 0) * 0.2;
-            update.smooth = { type: 'curvedCW', roundness: roundness };
-        }
-        edgeUpdates.push(update);
-    });
-    edges.update(edgeUpdates);
-
-    // Camera: fit trail + primary pair, adjacents are peripheral
+    // Camera: fit trail + primary pair, adjacents are peripheral. The target
+    // scale is computed first so label sizes can go out with the visibility
+    // changes in one update per dataset.
     var fitNodeIds = [focusedNodeId, c.nid];
     trailNids.forEach(function(nid) { if (fitNodeIds.indexOf(nid) < 0) fitNodeIds.push(nid); });
     var positions = network.getPositions(fitNodeIds);
@@ -1038,9 +1192,9 @@ function highlightConn(idx) {
     var rangeX = (maxX - minX) + pad * 2;
     var rangeY = (maxY - minY) + pad * 2;
 
-    var canvasEl = network.canvas.frame.canvas;
-    var totalW = canvasEl.clientWidth;
-    var totalH = canvasEl.clientHeight;
+    var size = getCanvasSize();
+    var totalW = size.w;
+    var totalH = size.h;
     var leftW = 352;
     var rightW = dp.classList.contains('open') ? 320 : 0;
     var visW = totalW - leftW - rightW;
@@ -1051,51 +1205,108 @@ function highlightConn(idx) {
     var visCenterPx = leftW + visW / 2;
     var shiftPx = visCenterPx - totalW / 2;
 
+    // Fonts: primary pair large + white, trail nodes medium + gray, adjacents small + dim
+    var nodeFontSize = Math.round(20 / scale);
+    var adjFontSize = Math.round(9 / scale);
+    var ghostFontSize = Math.round(6 / scale);
+    var edgeFontSize = Math.round(16 / scale);
+    var smallEdgeFont = Math.round(4 / scale);
+    var strokeW = Math.max(3, Math.round(3 / scale));
+
+    // Nodes: primary pair full, trail visible, adjacents ghosted, focus neighbors faint
+    var nodeUpdates = [];
+    allNodes.forEach(function(n) {
+        var isPrimary = n.id === focusedNodeId || n.id === c.nid;
+        var isAdj = adjIds.has(n.id);
+        var isTrail = trailNids.has(n.id);
+        var isFocusNeighbor = focusNeighborIds.has(n.id);
+        var visible = isPrimary || isAdj || isTrail || isFocusNeighbor;
+        var opacity = isPrimary || isTrail ? 1.0 : isAdj ? 0.35 : isFocusNeighbor ? 0.15 : 1.0;
+        var update = { id: n.id, hidden: !visible, opacity: opacity };
+        if (isPrimary) {
+            update.font = { size: nodeFontSize, color: '#ffffff', strokeWidth: strokeW, strokeColor: '#1a1a2e' };
+        } else if (isTrail) {
+            update.font = { size: adjFontSize, color: '#aaaaaa', strokeWidth: strokeW, strokeColor: '#1a1a2e' };
+        } else if (isAdj) {
+            update.font = { size: adjFontSize, color: '#555555', strokeWidth: strokeW, strokeColor: '#1a1a2e' };
+        } else if (isFocusNeighbor) {
+            update.font = { size: ghostFontSize, color: '#333333', strokeWidth: strokeW, strokeColor: '#1a1a2e' };
+        }
+        nodeUpdates.push(update);
+    });
+    nodes.update(nodeUpdates);
+    nodeHiddenKnown = false;
+    searchStateKnown = false;
+
+    // Edges: primary thick + labeled, trail visible + labeled, adjacent thin, focus-neighbor faint
+    var trailEids = getTrailEdgeIds();
+    var trailPersp = getTrailEdgePerspectives();
+    // Edges outside the last focus pass's shown set are already hidden and
+    // can only show now if they touch the pair, the focused node or the
+    // trail, so when that set is known only those edges are restyled.
+    var candidates = allEdges;
+    if (focusShownEdges !== null) {
+        var seenEdges = new Set();
+        candidates = [];
+        var addCandidate = function(e) {
+            if (!seenEdges.has(e)) {
+                seenEdges.add(e);
+                candidates.push(e);
+            }
+        };
+        focusShownEdges.forEach(addCandidate);
+        incidentEdges(c.nid).forEach(addCandidate);
+        incidentEdges(focusedNodeId).forEach(addCandidate);
+        trailNids.forEach(function(nid) {
+            incidentEdges(nid).forEach(function(e) { if (trailEids.has(e.id)) addCandidate(e); });
+        });
+    }
+    var edgeUpdates = [];
+    var shownEdges = [];
+    candidates.forEach(function(e) {
+        var isPrimary = (e.from === focusedNodeId && e.to === c.nid) || (e.to === focusedNodeId && e.from === c.nid);
+        var isAdj = (e.from === c.nid && adjIds.has(e.to)) || (e.to === c.nid && adjIds.has(e.from));
+        var isTrail = trailEids.has(e.id);
+        var isFocusEdge = (e.from === focusedNodeId && focusNeighborIds.has(e.to)) || (e.to === focusedNodeId && focusNeighborIds.has(e.from));
+        var relShown = !hiddenRelationTypes.has(e.relation_type);
+        var show = (isPrimary || isAdj || isTrail || isFocusEdge) && relShown;
+        var origWidth = Math.min(10, 1.5 + (e.support_count || 1) * 2);
+        var origColor = (typeof e.color === 'string') ? e.color : (e.color && e.color.color) || '#888';
+        var edgeOpacity = isPrimary || isTrail ? 1.0 : isAdj ? 0.25 : isFocusEdge ? 0.1 : 0.25;
+        var edgePerspective = isTrail ? (trailPersp[e.id] || focusedNodeId) : focusedNodeId;
+        var update = {
+            id: e.id,
+            hidden: !show,
+            color: { color: origColor, opacity: edgeOpacity },
+            label: (isPrimary || isTrail) ? edgeLabelFrom(e, edgePerspective) : '',
+            width: isPrimary ? Math.max(3, origWidth) : (isTrail ? origWidth : 1),
+            font: (isPrimary || isTrail) && relShown
+                ? { size: edgeFontSize, color: '#ffffff', strokeWidth: strokeW, strokeColor: '#1a1a2e' }
+                : { size: smallEdgeFont, color: '#333333', strokeWidth: 0, strokeColor: '#1a1a2e' }
+        };
+        if (isPrimary && primaryCount > 1) {
+            var roundness = 0.15 + (primaryIndex.get(e) || 0) * 0.2;
+            update.smooth = { type: 'curvedCW', roundness: roundness };
+        }
+        if (show) shownEdges.push(e);
+        edgeUpdates.push(update);
+    });
+    edges.update(edgeUpdates);
+    edgeFocusHiddenKnown = false;
+    focusShownEdges = shownEdges;
+
     network.moveTo({
         position: { x: midX - shiftPx / scale, y: midY },
         scale: scale,
         animation: { duration: 300, easingFunction: 'easeInOutQuad' }
     });
-
-    // Fonts: primary pair large + white, trail nodes medium + gray, adjacents small + dim
-    (function() {
-        var nodeFontSize = Math.round(20 / scale);
-        var adjFontSize = Math.round(9 / scale);
-        var ghostFontSize = Math.round(6 / scale);
-        var edgeFontSize = Math.round(16 / scale);
-        var strokeW = Math.max(3, Math.round(3 / scale));
-
-        var fontUpdatesN = [];
-        allNodes.forEach(function(n) {
-            if (n.id === focusedNodeId || n.id === c.nid) {
-                fontUpdatesN.push({ id: n.id, font: { size: nodeFontSize, color: '#ffffff', strokeWidth: strokeW, strokeColor: '#1a1a2e' } });
-            } else if (trailNids.has(n.id)) {
-                fontUpdatesN.push({ id: n.id, font: { size: adjFontSize, color: '#aaaaaa', strokeWidth: strokeW, strokeColor: '#1a1a2e' } });
-            } else if (adjIds.has(n.id)) {
-                fontUpdatesN.push({ id: n.id, font: { size: adjFontSize, color: '#555555', strokeWidth: strokeW, strokeColor: '#1a1a2e' } });
-            } else if (focusNeighborIds.has(n.id)) {
-                fontUpdatesN.push({ id: n.id, font: { size: ghostFontSize, color: '#333333', strokeWidth: strokeW, strokeColor: '#1a1a2e' } });
-            }
-        });
-        nodes.update(fontUpdatesN);
-
-        var fontUpdatesE = [];
-        var smallEdgeFont = Math.round(4 / scale);
-        allEdges.forEach(function(e) {
-            var isPrimary = (e.from === focusedNodeId && e.to === c.nid) || (e.to === focusedNodeId && e.from === c.nid);
-            var isTrail = trailEids.has(e.id);
-            if ((isPrimary || isTrail) && !hiddenRelationTypes.has(e.relation_type)) {
-                fontUpdatesE.push({ id: e.id, font: { size: edgeFontSize, color: '#ffffff', strokeWidth: strokeW, strokeColor: '#1a1a2e' } });
-            } else {
-                fontUpdatesE.push({ id: e.id, font: { size: smallEdgeFont, color: '#333333', strokeWidth: 0, strokeColor: '#1a1a2e' } });
-            }
-        });
-        edges.update(fontUpdatesE);
-    })();
 }
 
 // --- Overview hover preview: show name + highlight connections ---
 var overviewHoveredId = null;
+// Nodes and edges the current hover preview restyled, for blurNode to reset
+var hoverNodeIds = [];
+var hoverEdgeIds = [];
 network.on('hoverNode', function(params) {
     if (focusedNodeId !== null) return;  // focus mode handles its own display
     var nid = params.node;
@@ -1108,10 +1319,14 @@ network.on('hoverNode', function(params) {
     // Find connected neighbors
     var neighborIds = new Set();
     var connEdgeIds = new Set();
-    allEdges.forEach(function(e) {
+    incidentEdges(nid).forEach(function(e) {
         if (e.from === nid) { neighborIds.add(e.to); connEdgeIds.add(e.id); }
         if (e.to === nid) { neighborIds.add(e.from); connEdgeIds.add(e.id); }
     });
+    hoverNodeIds = [nid];
+    neighborIds.forEach(function(id) { hoverNodeIds.push(id); });
+    hoverEdgeIds = [];
+    connEdgeIds.forEach(function(eid) { hoverEdgeIds.push(eid); });
 
     // Show hovered node label + dim neighbor labels
     var nodeUpdates = [];
@@ -1120,6 +1335,7 @@ network.on('hoverNode', function(params) {
         nodeUpdates.push({ id: id, font: { size: neighborSize, color: '#999999', strokeWidth: strokeW, strokeColor: '#1a1a2e' } });
     });
     nodes.update(nodeUpdates);
+    searchStateKnown = false;
 
     // Brighten connected edges
     var edgeUpdates = [];
@@ -1134,19 +1350,14 @@ network.on('blurNode', function(params) {
     if (overviewHoveredId === null) return;
     overviewHoveredId = null;
 
-    // Reset all node fonts to 0 (overview default)
-    var nodeResets = [];
-    allNodes.forEach(function(n) {
-        nodeResets.push({ id: n.id, font: { size: 0 } });
-    });
-    nodes.update(nodeResets);
+    // Reset the previewed node fonts to 0 (overview default)
+    nodes.update(hoverNodeIds.map(function(id) { return { id: id, font: { size: 0 } }; }));
+    searchStateKnown = false;
 
-    // Reset all edge opacities
-    var edgeResets = [];
-    allEdges.forEach(function(e) {
-        edgeResets.push({ id: e.id, color: { opacity: 0.2 } });
-    });
-    edges.update(edgeResets);
+    // Reset the brightened edge opacities
+    edges.update(hoverEdgeIds.map(function(eid) { return { id: eid, color: { opacity: 0.2 } }; }));
+    hoverNodeIds = [];
+    hoverEdgeIds = [];
 });
 
 // Hover-to-reveal edge labels + support tooltip in focus mode
@@ -1185,8 +1396,19 @@ document.getElementById('mynetwork').addEventListener('mousemove', function(ev)
     }
 });
 
+// Edges the last enterFocusMode pass hid outright, by allEdges index.
+// Stepping between focused nodes re-hides most of the graph each time, so
+// edges still hidden from the previous pass are skipped. Any other write
+// to edge visibility clears edgeFocusHiddenKnown.
+var edgeFocusHidden = new Uint8Array(allEdges.length);
+var edgeFocusHiddenKnown = false;
+// Edges the last focus or pair-highlight pass may have shown; every other
+// edge is hidden. null when something else has written edge visibility.
+var focusShownEdges = null;
+
 function enterFocusMode(nodeId, skipCamera) {
     if (focusedNodeId === nodeId && focusConnIndex < 0) return;  // already in neighborhood view
+    cancelConnHighlight();
     overviewHoveredId = null;  // clear any hover preview state
     focusedNodeId = nodeId;
     var node = nodes.get(nodeId);
@@ -1198,26 +1420,73 @@ function enterFocusMode(nodeId, skipCamera) {
     banner.classList.add('visible');
 
     // Find all 1-hop neighbors, ranked by degree
-    var allNeighbors = [];
-    var neighborDeg = {};
     var connectedEdgeIds = new Set();
-    allEdges.forEach(function(e) {
-        if (e.from === nodeId) { connectedEdgeIds.add(e.id); if (!neighborDeg[e.to]) { neighborDeg[e.to] = 0; allNeighbors.push(e.to); } neighborDeg[e.to]++; }
-        if (e.to === nodeId) { connectedEdgeIds.add(e.id); if (!neighborDeg[e.from]) { neighborDeg[e.from] = 0; allNeighbors.push(e.from); } neighborDeg[e.from]++; }
-    });
+    incidentEdges(nodeId).forEach(function(e) { connectedEdgeIds.add(e.id); });
 
-    // Sort by global degree, cap visible neighbors for dense hubs
-    allNeighbors.sort(function(a, b) {
-        var da = 0, db = 0;
-        allNodes.forEach(function(n) { if (n.id === a) da = n.node_degree || 0; if (n.id === b) db = n.node_degree || 0; });
-        return db - da;
-    });
+    // Cap visible neighbors for dense hubs
+    var allNeighbors = rankedNeighbors(nodeId);
     var MAX_NEIGHBORS = 25;
     var visibleNeighbors = new Set(allNeighbors.slice(0, MAX_NEIGHBORS));
     visibleNeighbors.add(nodeId);
     var trailNodeIds = getTrailNodeIds();
     trailNodeIds.forEach(function(nid) { visibleNeighbors.add(nid); });
 
+    // Sidebar-aware camera fit. The target scale is known up front, so the
+    // scale-aware labels go out with the visibility changes below instead of
+    // in a second round of updates once the camera settles.
+    var camera = null;
+    if (!skipCamera) {
+        var fitIds = [];
+        visibleNeighbors.forEach(function(nid) { fitIds.push(nid); });
+        var positions = network.getPositions(fitIds);
+        var minX = Infinity, maxX = -Infinity, minY = Infinity, maxY = -Infinity;
+        fitIds.forEach(function(nid) {
+            var p = positions[nid];
+            if (!p) return;
+            if (p.x < minX) minX = p.x;
+            if (p.x > maxX) maxX = p.x;
+            if (p.y < minY) minY = p.y;
+            if (p.y > maxY) maxY = p.y;
+        });
+        var midX = (minX + maxX) / 2;
+        var midY = (minY + maxY) / 2;
+
+        var pad = 150;
+        var rangeX = (maxX - minX) + pad * 2;
+        var rangeY = (maxY - minY) + pad * 2;
+
+        var size = getCanvasSize();
+        var totalW = size.w;
+        var totalH = size.h;
+        var leftW = 352;
+        var rightW = dp.classList.contains('open') ? 320 : 0;
+        var visW = totalW - leftW - rightW;
+        var visH = totalH - 80;
+
+        var scale = Math.min(visW / rangeX, visH / rangeY, 1.2);
+
+        var visCenterPx = leftW + visW / 2;
+        var shiftPx = visCenterPx - totalW / 2;
+        camera = { x: midX - shiftPx / scale, y: midY, scale: scale };
+    }
+
+    // Labels at the target zoom: top 15 neighbors by degree + focused node + trail
+    var labelFont = null;
+    var trailEdgeFont = { size: 11, color: '#ccc', strokeWidth: 3, strokeColor: '#1a1a2e' };
+    var labeledSet = new Set();
+    if (camera) {
+        var strokeW = Math.max(2, Math.round(2 / camera.scale));
+        labelFont = { size: Math.round(14 / camera.scale), color: '#e0e0e0', strokeWidth: strokeW, strokeColor: '#1a1a2e' };
+        trailEdgeFont = { size: Math.round(12 / camera.scale), color: '#cccccc', strokeWidth: strokeW, strokeColor: '#1a1a2e' };
+        var maxLabeled = 15;
+        labeledSet.add(nodeId);
+        trailNodeIds.forEach(function(nid) { labeledSet.add(nid); });
+        for (var i = 0; i < Math.min(maxLabeled, allNeighbors.length); i++) {
+            if (visibleNeighbors.has(allNeighbors[i])) labeledSet.add(allNeighbors[i]);
+        }
+    }
+    var hiddenLabelFont = labelFont && { size: 0, color: labelFont.color, strokeWidth: labelFont.strokeWidth, strokeColor: labelFont.strokeColor };
+
     // Show top neighbors, hide rest
     var nodeUpdates = [];
     allNodes.forEach(function(n) {
@@ -1225,9 +1494,13 @@ function enterFocusMode(nodeId, skipCamera) {
         var isFocused = n.id === nodeId;
         var isTrail = trailNodeIds.has(n.id);
         var belowDegree = (n.node_degree || 0) < minDegree;
-        nodeUpdates.push({ id: n.id, hidden: !isVisible || (!isFocused && !isTrail && belowDegree), opacity: 1.0, font: { size: 14, color: '#e0e0e0' } });
+        var font = { size: 14, color: '#e0e0e0' };
+        if (labelFont && isVisible) font = labeledSet.has(n.id) ? labelFont : hiddenLabelFont;
+        nodeUpdates.push({ id: n.id, hidden: !isVisible || (!isFocused && !isTrail && belowDegree), opacity: 1.0, font: font });
     });
     nodes.update(nodeUpdates);
+    nodeHiddenKnown = false;
+    searchStateKnown = false;
 
     // Show static edge labels only for small neighborhoods
     var showStaticLabels = visibleNeighbors.size <= 20;
@@ -1239,133 +1512,86 @@ function enterFocusMode(nodeId, skipCamera) {
     // Count parallel edges per node pair to offset curves. Include trail edges so
     // multi-relation trail steps (e.g. APPLIED_TO + EXPLAINS between the same two
     // nodes) get staggered curvatures instead of stacking on top of each other.
-    var pairCount = {};
-    var pairIndex = {};
-    allEdges.forEach(function(e) {
-        if (!connectedEdgeIds.has(e.id) && !trailEdgeIds.has(e.id)) return;
-        var key = [e.from, e.to].sort().join('||');
-        if (!pairCount[key]) pairCount[key] = 0;
-        pairIndex[e.id] = pairCount[key];
-        pairCount[key]++;
-    });
+    // Only these edges are counted, so walk them through the adjacency index
+    // (same per-pair order as allEdges) rather than scanning every edge.
+    // allEdges objects are shared with the index, so edges key the Map
+    // directly instead of through their string ids.
+    var pairCount = new Map();
+    var pairIndex = new Map();
+    function countPair(e) {
+        if (pairIndex.has(e)) return;
+        var key = pairKey(e.from, e.to);
+        var idx = pairCount.get(key) || 0;
+        pairIndex.set(e, idx);
+        pairCount.set(key, idx + 1);
+    }
+    incidentEdges(nodeId).forEach(countPair);
+    var trailSteps = getTrailPath();
+    for (var t = 0; t < trailSteps.length - 1; t++) {
+        incidentEdges(trailSteps[t].nodeId).forEach(function(e) {
+            if (trailEdgeIds.has(e.id)) countPair(e);
+        });
+    }
 
-    function curvature(edgeId, fromId, toId) {
-        var key = [fromId, toId].sort().join('||');
-        var total = pairCount[key] || 1;
-        var idx = pairIndex[edgeId] || 0;
+    function curvature(e) {
+        var total = pairCount.get(pairKey(e.from, e.to)) || 1;
+        var idx = pairIndex.get(e) || 0;
         return total > 1 ? 0.15 + idx * 0.2 : 0.1;
     }
 
     var edgeUpdates = [];
-    allEdges.forEach(function(e) {
+    var skipHidden = edgeFocusHiddenKnown;
+    function hideEdge(e, i) {
+        if (skipHidden && edgeFocusHidden[i]) return;
+        edgeFocusHidden[i] = 1;
+        edgeUpdates.push({ id: e.id, hidden: true });
+    }
+    var shownEdges = [];
+    allEdges.forEach(function(e, i) {
         var isTrailEdge = trailEdgeIds.has(e.id);
         if (isTrailEdge) {
+            edgeFocusHidden[i] = 0;
+            shownEdges.push(e);
             edgeUpdates.push({
                 id: e.id,
                 hidden: false,
                 color: { opacity: 0.6 },
-                font: { size: 11, color: '#ccc', strokeWidth: 3, strokeColor: '#1a1a2e' },
+                font: trailEdgeFont,
                 label: edgeLabelFrom(e, trailEdgePersp[e.id] || nodeId),
-                smooth: { type: 'curvedCW', roundness: curvature(e.id, e.from, e.to) }
+                smooth: { type: 'curvedCW', roundness: curvature(e) }
             });
         } else if (connectedEdgeIds.has(e.id)) {
             var other = e.from === nodeId ? e.to : e.from;
             if (!visibleNeighbors.has(other)) {
-                edgeUpdates.push({ id: e.id, hidden: true });
+                hideEdge(e, i);
                 return;
             }
+            edgeFocusHidden[i] = 0;
+            shownEdges.push(e);
             edgeUpdates.push({
                 id: e.id,
                 hidden: hiddenRelationTypes.has(e.relation_type),
                 color: { opacity: 0.6 },
                 font: { size: showStaticLabels ? 11 : 0, color: '#ccc', strokeWidth: 3, strokeColor: '#1a1a2e' },
                 label: showStaticLabels ? edgeLabelFrom(e, nodeId) : '',
-                smooth: { type: 'curvedCW', roundness: curvature(e.id, e.from, e.to) }
+                smooth: { type: 'curvedCW', roundness: curvature(e) }
             });
         } else {
-            edgeUpdates.push({ id: e.id, hidden: true });
+            hideEdge(e, i);
         }
     });
     edges.update(edgeUpdates);
+    edgeFocusHiddenKnown = true;
+    focusShownEdges = shownEdges;
 
     if (!skipCamera) focusConnIndex = -1;
 
-    if (!skipCamera) {
-        // Sidebar-aware camera fit
-        var fitIds = [];
-        visibleNeighbors.forEach(function(nid) { fitIds.push(nid); });
-        var positions = network.getPositions(fitIds);
-        var minX = Infinity, maxX = -Infinity, minY = Infinity, maxY = -Infinity;
-        fitIds.forEach(function(nid) {
-            var p = positions[nid];
-            if (!p) return;
-            if (p.x < minX) minX = p.x;
-            if (p.x > maxX) maxX = p.x;
-            if (p.y < minY) minY = p.y;
-            if (p.y > maxY) maxY = p.y;
-        });
-        var midX = (minX + maxX) / 2;
-        var midY = (minY + maxY) / 2;
-
-        var pad = 150;
-        var rangeX = (maxX - minX) + pad * 2;
-        var rangeY = (maxY - minY) + pad * 2;
-
-        var canvasEl = network.canvas.frame.canvas;
-        var totalW = canvasEl.clientWidth;
-        var totalH = canvasEl.clientHeight;
-        var leftW = 352;
-        var rightW = dp.classList.contains('open') ? 320 : 0;
-        var visW = totalW - leftW - rightW;
-        var visH = totalH - 80;
-
-        var scale = Math.min(visW / rangeX, visH / rangeY, 1.2);
-
-        var visCenterPx = leftW + visW / 2;
-        var shiftPx = visCenterPx - totalW / 2;
-
+    if (camera) {
         network.moveTo({
-            position: { x: midX - shiftPx / scale, y: midY },
-            scale: scale,
+            position: { x: camera.x, y: camera.y },
+            scale: camera.scale,
             animation: { duration: 400, easingFunction: 'easeInOutQuad' }
         });
-
-        // After camera settles, apply scale-aware labels on top neighbors
-        setTimeout(function() {
-            var s = network.getScale();
-            var fontSize = Math.round(14 / s);
-            var strokeW = Math.max(2, Math.round(2 / s));
-
-            // Label top 15 by degree + focused node
-            var maxLabeled = 15;
-            var labeledSet = new Set();
-            labeledSet.add(nodeId);
-            var trailIds = getTrailNodeIds();
-            trailIds.forEach(function(nid) { labeledSet.add(nid); });
-            for (var i = 0; i < Math.min(maxLabeled, allNeighbors.length); i++) {
-                if (visibleNeighbors.has(allNeighbors[i])) labeledSet.add(allNeighbors[i]);
-            }
-
-            var updates = [];
-            allNodes.forEach(function(n) {
-                if (visibleNeighbors.has(n.id)) {
-                    var show = labeledSet.has(n.id);
-                    updates.push({ id: n.id, font: { size: show ? fontSize : 0, color: '#e0e0e0', strokeWidth: strokeW, strokeColor: '#1a1a2e' } });
-                }
-            });
-            nodes.update(updates);
-
-            // Upscale trail edge labels to match current zoom
-            var trailEids = getTrailEdgeIds();
-            if (trailEids.size > 0) {
-                var trailEdgeFontSize = Math.round(12 / s);
-                var edgeUpdatesTrail = [];
-                trailEids.forEach(function(eid) {
-                    edgeUpdatesTrail.push({ id: eid, font: { size: trailEdgeFontSize, color: '#cccccc', strokeWidth: strokeW, strokeColor: '#1a1a2e' } });
-                });
-                edges.update(edgeUpdatesTrail);
-            }
-        }, 450);
     }
 
     if (focusHistory.length > 0) {
@@ -1375,14 +1601,20 @@ function enterFocusMode(nodeId, skipCamera) {
     }
 }
 
+// Overview edge curve, matching the page's edges.smooth option (straight on
+// large graphs)
+var OVERVIEW_EDGE_SMOOTH = SIFT_CONFIG.straightEdges ? false : { type: 'curvedCW', roundness: 0.1 };
+
 function exitFocusMode() {
     if (focusedNodeId === null) {
         closeDetail();
         return;
     }
+    cancelConnHighlight();
     focusedNodeId = null;
     focusConnIndex = -1;
     focusHistory = [];
+    connRowsCache = [];
 
     // Hide banner
     document.getElementById('focus-banner').classList.remove('visible');
@@ -1394,6 +1626,7 @@ function exitFocusMode() {
         fontResets.push({ id: n.id, font: { size: 0, color: '#e0e0e0' }, opacity: 1.0 });
     });
     nodes.update(fontResets);
+    searchStateKnown = false;
 
     // Restore edges — re-apply edge filters, reset labels and curves
     var edgeUpdates = [];
@@ -1404,10 +1637,12 @@ function exitFocusMode() {
             color: { opacity: 0.2 },
             font: { size: 0 },
             label: '',
-            smooth: { type: 'curvedCW', roundness: 0.1 }
+            smooth: OVERVIEW_EDGE_SMOOTH
         });
     });
     edges.update(edgeUpdates);
+    edgeFocusHiddenKnown = false;
+    focusShownEdges = null;
 
     // Fit camera back to full graph
     network.fit({ animation: { duration: 400, easingFunction: 'easeInOutQuad' } });
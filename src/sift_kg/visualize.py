@@ -6,21 +6,206 @@ interactive color pickers, type toggles, community filters, search,
 and detail sidebar.
 """
 
+import hashlib
 import json
 import logging
 import math
-import random
 import re
 import webbrowser
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 import networkx as nx
 
+from sift_kg.graph.communities import louvain_communities, weighted_adjacency
 from sift_kg.graph.knowledge_graph import KnowledgeGraph
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # optional speedup: pip install sift-kg[fast]
+    ORJSON_AVAILABLE = False
+
+try:
+    import igraph as ig
+
+    IGRAPH_AVAILABLE = True
+except ImportError:  # optional speedup: pip install sift-kg[fast]
+    IGRAPH_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+# Radius (px) of the disc a community's nodes are seeded in around its center
+_SEED_RADIUS = 250
+
+# Golden angle in radians: successive sunflower seeds turn by this much
+_GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+
+# Viewer-computed communities, cached next to the HTML. Kept apart from
+# communities.json, which belongs to build/narrate and carries their labels.
+_VIEW_COMMUNITIES_FILE = "view_communities.json"
+
+# From this size Louvain takes seconds, enough to be worth overlapping with
+# graph filtering in a worker process.
+_BACKGROUND_LOUVAIN_MIN_NODES = 5000
+
+# From this size the browser's forceAtlas2 stabilization delays first paint
+# by seconds; with igraph installed the layout is computed here instead and
+# the nodes ship pinned (physics off), so stabilization has nothing to move.
+_PRESET_LAYOUT_MIN_NODES = 1500
+
+# vis.js pixels per unit of igraph's Fruchterman-Reingold layout
+_PRESET_LAYOUT_SCALE = 150
+
+# Above this many entities the browser struggles to draw every node, so the
+# viewer shows one node per community instead (--community opens one).
+_AGGREGATE_MIN_NODES = 3000
+
+# Above this many edges the overview draws them straight: curved edges cost
+# a Bezier evaluation per edge per frame. Focus mode still curves the edges
+# it shows, to fan out parallel relations.
+_STRAIGHT_EDGES_MIN_EDGES = 2000
+
+
+def _graph_fingerprint(graph: nx.MultiDiGraph) -> str:
+    """Hash of the node and edge structure, used to invalidate cached communities."""
+    digest = hashlib.sha1()
+    for nid in sorted(graph.nodes):
+        digest.update(f"{nid}\n".encode())
+    for u, v in sorted(graph.edges()):
+        digest.update(f"{u}\0{v}\n".encode())
+    return digest.hexdigest()
+
+
+def _preset_layout(
+    graph: nx.MultiDiGraph, seeds: dict[str, tuple[float, float]],
+) -> dict[str, tuple[float, float]]:
+    """Fruchterman-Reingold node positions from igraph's C implementation.
+
+    Args:
+        graph: Graph to lay out; direction and parallel edges are ignored.
+        seeds: Starting position of every node, in vis.js pixels.
+
+    Returns:
+        Node id → (x, y) in vis.js pixels, rounded to 0.1.
+    """
+    nodes = list(graph)
+    index = {n: i for i, n in enumerate(nodes)}
+    g = ig.Graph(n=len(nodes), edges=[(index[u], index[v]) for u, v in graph.edges()])
+    g.simplify()
+    start = [[x / _PRESET_LAYOUT_SCALE, y / _PRESET_LAYOUT_SCALE] for x, y in (seeds[n] for n in nodes)]
+    layout = g.layout_fruchterman_reingold(seed=start, niter=500)
+    return {
+        n: (round(x * _PRESET_LAYOUT_SCALE, 1), round(y * _PRESET_LAYOUT_SCALE, 1))
+        for n, (x, y) in zip(nodes, layout.coords, strict=True)
+    }
+
+
+def _seed_positions(
+    graph: nx.MultiDiGraph,
+    community_map: dict[str, str],
+    community_layout: dict[str, tuple[str, float, float]],
+) -> dict[str, tuple[float, float]]:
+    """Starting position of every node: a sunflower spiral per community.
+
+    Each community's nodes fill a disc of ``_SEED_RADIUS`` around its center
+    at evenly spread, deterministic points, so stabilization starts without
+    the overlapping pairs random jitter produces.
+
+    Returns:
+        Node id → (x, y) in vis.js pixels, rounded to 0.1 (sub-pixel
+        precision only bloats the embedded JSON).
+    """
+    sizes: dict[str, int] = {}
+    for node_id in graph:
+        label = community_map.get(node_id, "")
+        sizes[label] = sizes.get(label, 0) + 1
+
+    placed: dict[str, int] = {}
+    positions: dict[str, tuple[float, float]] = {}
+    for node_id in graph:
+        label = community_map.get(node_id, "")
+        _, center_x, center_y = community_layout.get(label, community_layout[""])
+        j = placed.get(label, 0)
+        placed[label] = j + 1
+        r = _SEED_RADIUS * math.sqrt((j + 0.5) / sizes[label])
+        theta = j * _GOLDEN_ANGLE
+        positions[node_id] = (
+            round(center_x + r * math.cos(theta), 1),
+            round(center_y + r * math.sin(theta), 1),
+        )
+    return positions
+
+
+def _view_communities(kg: KnowledgeGraph, cache_path: Path) -> Future:
+    """Louvain communities of the full graph, reused from ``cache_path`` when the graph is unchanged.
+
+    On graphs of ``_BACKGROUND_LOUVAIN_MIN_NODES`` or more, Louvain runs in a
+    worker process so the caller can strip and filter the graph meanwhile.
+    Cache hits and small graphs resolve before this returns.
+
+    Returns:
+        Future resolving to a node id → "Community N" map ({} when the
+        graph doesn't split or detection fails).
+    """
+    done: Future = Future()
+    fingerprint = _graph_fingerprint(kg.graph)
+    if cache_path.exists():
+        try:
+            cached = _load_json(cache_path)
+            if cached.get("graph_hash") == fingerprint:
+                done.set_result(cached["communities"])
+                return done
+        except (ValueError, KeyError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable {cache_path.name}: {e}")
+
+    # Use full graph (with DOCUMENT nodes + MENTIONED_IN edges) —
+    # shared-document connectivity produces better entity clustering
+    adjacency = weighted_adjacency(kg.graph)
+
+    def finish(partition: Future) -> None:
+        # Runs in the pool's callback thread for background runs; must
+        # always resolve ``done`` or generate_view would wait forever.
+        try:
+            raw = partition.result()
+        except Exception as e:
+            logger.debug(f"Background community detection failed, retrying inline: {e}")
+            try:
+                raw = louvain_communities(adjacency, seed=42)
+            except Exception:
+                done.set_result({})
+                return
+
+        community_map: dict[str, str] = {}
+        if len(raw) > 1:
+            for i, comm in enumerate(sorted(raw, key=len, reverse=True)):
+                for nid in comm:
+                    community_map[nid] = f"Community {i + 1}"
+        try:
+            cache_path.write_bytes(_dump_json({"graph_hash": fingerprint, "communities": community_map}))
+        except OSError as e:
+            logger.debug(f"Could not cache view communities: {e}")
+        done.set_result(community_map)
+
+    if adjacency.number_of_nodes() >= _BACKGROUND_LOUVAIN_MIN_NODES:
+        pool = ProcessPoolExecutor(max_workers=1)
+        partition = pool.submit(louvain_communities, adjacency, 42)
+        pool.shutdown(wait=False)
+    else:
+        partition = Future()
+        try:
+            partition.set_result(louvain_communities(adjacency, seed=42))
+        except Exception:
+            done.set_result({})
+            return done
+    partition.add_done_callback(finish)
+    return done
+
+
 def _community_sort_key(label: str) -> tuple[str, int]:
     """Sort 'Community 12' numerically, not lexicographically."""
     m = re.search(r"(\d+)$", label)
@@ -110,27 +295,24 @@ SEMANTIC_EDGE_COLORS = {
 
 def _color_for_entity(entity_type: str, entity_color_map: dict[str, str]) -> str:
     """Get or assign a color for an entity type."""
-    if entity_type in entity_color_map:
-        return entity_color_map[entity_type]
-    if entity_type in SEMANTIC_ENTITY_COLORS:
-        entity_color_map[entity_type] = SEMANTIC_ENTITY_COLORS[entity_type]
-    else:
-        idx = len(entity_color_map) % len(NODE_PALETTE)
-        entity_color_map[entity_type] = NODE_PALETTE[idx]
-    return entity_color_map[entity_type]
+    color = entity_color_map.get(entity_type)
+    if color is None:
+        color = SEMANTIC_ENTITY_COLORS.get(entity_type)
+        if color is None:
+            color = NODE_PALETTE[len(entity_color_map) % len(NODE_PALETTE)]
+        entity_color_map[entity_type] = color
+    return color
 
 
 def _color_for_relation(rel_type: str, rel_color_map: dict[str, str]) -> str:
     """Get or assign a color for a relation type."""
-    if rel_type in rel_color_map:
-        return rel_color_map[rel_type]
-    if rel_type in SEMANTIC_EDGE_COLORS:
-        rel_color_map[rel_type] = SEMANTIC_EDGE_COLORS[rel_type]
-    else:
-        idx = len(rel_color_map) % len(EDGE_PALETTE)
-        rel_color_map[rel_type] = EDGE_PALETTE[idx]
-    return rel_color_map[rel_type]
-
+    color = rel_color_map.get(rel_type)
+    if color is None:
+        color = SEMANTIC_EDGE_COLORS.get(rel_type)
+        if color is None:
+            color = EDGE_PALETTE[len(rel_color_map) % len(EDGE_PALETTE)]
+        rel_color_map[rel_type] = color
+    return color
 
 
 def filter_graph(
@@ -225,15 +407,85 @@ def filter_graph(
             keep_top.update(undirected.neighbors(hub))
         g.remove_nodes_from([n for n in g.nodes() if n not in keep_top])
 
-    # Build new KG from filtered graph
-    filtered = KnowledgeGraph(
+    return _with_graph(kg, g)
+
+
+def _with_graph(kg: KnowledgeGraph, graph: nx.MultiDiGraph) -> KnowledgeGraph:
+    """New KnowledgeGraph wrapping ``graph``, with ``kg``'s settings and timestamps."""
+    derived = KnowledgeGraph(
         canonicalize_relations=kg.canonicalize_relations,
         confidence_aggregation=kg.confidence_aggregation,
     )
-    filtered.created_at = kg.created_at
-    filtered.updated_at = kg.updated_at
-    filtered.graph = g
-    return filtered
+    derived.created_at = kg.created_at
+    derived.updated_at = kg.updated_at
+    derived.graph = graph
+    return derived
+
+
+def _community_overview(
+    kg: KnowledgeGraph, community_map: dict[str, str],
+) -> tuple[KnowledgeGraph, dict[str, str], dict[str, str]]:
+    """Collapse each community into a single node for graphs too big to draw.
+
+    Communities are linked by one edge whose support count is the number of
+    relations between their members. Entities outside any community are
+    left out.
+
+    Returns:
+        (overview graph, its node id → community label,
+        node id → detail-panel description)
+    """
+    members: dict[str, list[str]] = {}
+    for node_id in kg.graph:
+        label = community_map.get(node_id)
+        if label:
+            members.setdefault(label, []).append(node_id)
+
+    g = nx.MultiDiGraph()
+    overview_map: dict[str, str] = {}
+    descriptions: dict[str, str] = {}
+    degree = kg.graph.degree
+    for label in sorted(members, key=_community_sort_key):
+        node_ids = members[label]
+        docs: set[str] = set()
+        for nid in node_ids:
+            source_docs = kg.graph.nodes[nid].get("source_documents", [])
+            if isinstance(source_docs, list):
+                docs.update(source_docs)
+        hubs = sorted(node_ids, key=lambda n: -degree[n])[:5]
+        overview_id = f"community:{label}"
+        g.add_node(
+            overview_id,
+            entity_type="COMMUNITY",
+            name=label,
+            confidence=1.0,
+            source_documents=sorted(docs),
+            attributes={
+                "entities": len(node_ids),
+                "hubs": ", ".join(kg.graph.nodes[n].get("name", n) for n in hubs),
+            },
+        )
+        overview_map[overview_id] = label
+        descriptions[overview_id] = (
+            f'{len(node_ids)} entities. Run sift view --community "{label}" to explore them.'
+        )
+
+    links: dict[tuple[str, str], int] = {}
+    for u, v in kg.graph.edges():
+        cu, cv = community_map.get(u), community_map.get(v)
+        if cu and cv and cu != cv:
+            pair = (cu, cv) if cu < cv else (cv, cu)
+            links[pair] = links.get(pair, 0) + 1
+    for (cu, cv), count in links.items():
+        g.add_edge(
+            f"community:{cu}",
+            f"community:{cv}",
+            relation_type="LINKED_TO",
+            confidence=1.0,
+            support_count=count,
+            evidence=f"{count} relations between members",
+        )
+    return _with_graph(kg, g), overview_map, descriptions
 
 
 def generate_view(
@@ -249,14 +501,20 @@ def generate_view(
     neighborhood: str | None = None,
     depth: int = 1,
     community: str | None = None,
+    aggregate: bool = True,
 ) -> Path:
-    """Generate an interactive HTML visualization of the knowledge graph."""
+    """Generate an interactive HTML visualization of the knowledge graph.
+
+    Graphs of more than ``_AGGREGATE_MIN_NODES`` entities (after filtering)
+    are shown as one node per community unless ``aggregate`` is False;
+    naming a ``community`` then renders just that community's entities.
+    """
     from sift_kg.graph.postprocessor import strip_metadata
 
     # Load entity descriptions if available
     entity_descriptions: dict[str, str] = {}
     if descriptions_path and descriptions_path.exists():
-        entity_descriptions = json.loads(descriptions_path.read_text())
+        entity_descriptions = _load_json(descriptions_path)
         logger.info(f"Loaded {len(entity_descriptions)} entity descriptions for viewer")
 
     # Load or compute community assignments on FULL graph (before stripping)
@@ -264,48 +522,64 @@ def generate_view(
     community_map: dict[str, str] = {}
     communities_path = output_path.parent / "communities.json"
     if communities_path.exists():
-        community_map = json.loads(communities_path.read_text())
+        community_map = _load_json(communities_path)
         logger.info(f"Loaded {len(set(community_map.values()))} communities for viewer")
+    pending_communities = None
     if not community_map:
-        try:
-            # Use full graph (with DOCUMENT nodes + MENTIONED_IN edges) —
-            # shared-document connectivity produces better entity clustering
-            undirected = kg.graph.to_undirected()
-            raw = nx.community.louvain_communities(undirected, seed=42)
-            if len(raw) > 1:
-                for i, comm in enumerate(sorted(raw, key=len, reverse=True)):
-                    for nid in comm:
-                        community_map[nid] = f"Community {i + 1}"
-        except Exception:
-            pass
+        pending_communities = _view_communities(kg, output_path.parent / _VIEW_COMMUNITIES_FILE)
 
     # Strip metadata edges/nodes so filters operate on clean graph
     kg = strip_metadata(kg)
 
-    # Apply pre-filters
-    kg = filter_graph(
-        kg,
-        top_n=top_n,
-        min_confidence=min_confidence,
-        source_doc=source_doc,
-        neighborhood=neighborhood,
-        depth=depth,
-    )
+    # Apply pre-filters. strip_metadata already returned a fresh graph, so
+    # with no filters there is no need for filter_graph's second copy.
+    if top_n is not None or min_confidence is not None or source_doc or neighborhood:
+        kg = filter_graph(
+            kg,
+            top_n=top_n,
+            min_confidence=min_confidence,
+            source_doc=source_doc,
+            neighborhood=neighborhood,
+            depth=depth,
+        )
     if kg.entity_count == 0:
         logger.warning("All entities filtered out \u2014 nothing to visualize")
 
-    unique_communities = sorted(set(community_map.values()), key=_community_sort_key)
+    if pending_communities is not None:
+        community_map = pending_communities.result()
+    unique_communities = sorted({*community_map.values()}, key=_community_sort_key)
 
     # Normalize --community flag to match actual label (case-insensitive)
     if community:
         label_lookup = {c.lower(): c for c in unique_communities}
         community = label_lookup.get(community.lower(), community)
 
+    if aggregate and kg.entity_count > _AGGREGATE_MIN_NODES and len(unique_communities) > 1:
+        if community in unique_communities:
+            kg = _with_graph(kg, kg.graph.subgraph(
+                [nid for nid in kg.graph if community_map.get(nid) == community]
+            ).copy())
+        else:
+            logger.warning(
+                f"{kg.entity_count} entities is more than the viewer draws smoothly; "
+                f"showing {len(unique_communities)} communities instead. "
+                f"Use --community to open one, or --full to draw every entity."
+            )
+            kg, community_map, overview_descriptions = _community_overview(kg, community_map)
+            entity_descriptions.update(overview_descriptions)
+
+    # Colors and per-community (border color, center x, center y) in one
+    # pass over the sorted labels, so both dicts are in display order.
+    # Centers are spread on a circle so clusters start separated;
+    # unassigned nodes start at the origin.
     comm_colors = _generate_community_colors(len(unique_communities))
-    community_color_map = {
-        label: comm_colors[i]
-        for i, label in enumerate(unique_communities)
-    }
+    community_color_map: dict[str, str] = {}
+    community_layout: dict[str, tuple[str, float, float]] = {"": ("#333", 0.0, 0.0)}
+    radius = 1200
+    for i, (label, color) in enumerate(zip(unique_communities, comm_colors, strict=True)):
+        angle = 2 * math.pi * i / len(unique_communities)
+        community_color_map[label] = color
+        community_layout[label] = (color, radius * math.cos(angle), radius * math.sin(angle))
 
     try:
         from pyvis.network import Network
@@ -324,6 +598,9 @@ def generate_view(
         filter_menu=False,
     )
 
+    straight_edges = kg.relation_count > _STRAIGHT_EDGES_MIN_EDGES
+    edge_smooth = "false" if straight_edges else '{ "type": "curvedCW", "roundness": 0.1 }'
+
     # Physics: strong repulsion, freeze after stabilization
     net.set_options("""{
         "physics": {
@@ -341,7 +618,7 @@ def generate_view(
         },
         "edges": {
             "arrows": { "to": { "enabled": true, "scaleFactor": 1.2 } },
-            "smooth": { "type": "curvedCW", "roundness": 0.1 },
+            "smooth": EDGE_SMOOTH,
             "color": { "opacity": 0.2 },
             "font": { "size": 0, "align": "top" }
         },
@@ -358,160 +635,142 @@ def generate_view(
             "hideEdgesOnDrag": true,
             "hideEdgesOnZoom": true
         }
-    }""")
+    }""".replace("EDGE_SMOOTH", edge_smooth))
 
-    degrees = dict(kg.graph.degree())
+    # Deterministic starting positions, so regenerating a view gives the same
+    # layout. Large graphs are laid out here from those seeds instead.
+    positions = _seed_positions(kg.graph, community_map, community_layout)
+    preset_layout = IGRAPH_AVAILABLE and kg.graph.number_of_nodes() >= _PRESET_LAYOUT_MIN_NODES
+    if preset_layout:
+        positions = _preset_layout(kg.graph, positions)
 
-    # Seed initial positions by community so clusters start separated
-    community_centers: dict[str, tuple[float, float]] = {}
-    if unique_communities:
-        radius = 1200
-        for i, comm in enumerate(unique_communities):
-            angle = 2 * math.pi * i / len(unique_communities)
-            community_centers[comm] = (radius * math.cos(angle), radius * math.sin(angle))
+    # vis.js color dicts shared by every node with the same type + community
+    node_colors: dict[tuple[str, str], dict] = {}
 
     # Collect entity types — auto-assign colors as they appear
     entity_types_present: set[str] = set()
     entity_color_map: dict[str, str] = {}
-
-    # Add nodes
+    # Display names filled by the node pass, reused by the edge pass
+    name_by_id: dict[str, str] = {}
+    # vis.js node/edge dicts, handed to pyvis in one go (see _set_network_data)
+    vis_nodes: list[dict] = []
+    vis_edges: list[dict] = []
+    node_font = {"color": net.font_color}
+
+    # Add nodes (DegreeView lookups, no intermediate degree dict)
+    degrees = kg.graph.degree
     for node_id, data in kg.graph.nodes(data=True):
+        degree = degrees[node_id]
         entity_type = data.get("entity_type", "UNKNOWN")
         entity_types_present.add(entity_type)
         name = data.get("name", node_id)
+        name_by_id[node_id] = name
         confidence = data.get("confidence", 0)
         entity_color = _color_for_entity(entity_type, entity_color_map)
-        degree = degrees.get(node_id, 0)
 
         # Community border color
         comm_label = community_map.get(node_id, "")
-        comm_color = community_color_map.get(comm_label, "#333")
-        node_color = {
-            "background": entity_color,
-            "border": comm_color,
-            "highlight": {"background": entity_color, "border": comm_color},
-        }
+        comm_color = community_layout.get(comm_label, community_layout[""])[0]
+        node_color = node_colors.get((entity_type, comm_label))
+        if node_color is None:
+            node_color = node_colors[(entity_type, comm_label)] = {
+                "background": entity_color,
+                "border": comm_color,
+                "highlight": {"background": entity_color, "border": comm_color},
+            }
         border_w = 2.0 if comm_label else 1.5
 
-        tooltip_parts = [
-            name,
-            f"Type: {entity_type}",
-            f"Connections: {degree}",
-        ]
-        if comm_label:
-            tooltip_parts.append(f"Community: {comm_label}")
-        if isinstance(confidence, (int, float)):
-            tooltip_parts.append(f"Confidence: {confidence:.0%}")
+        # Detail-panel fields ship as structured values; app.js formats them
+        # on click (hover tooltips are disabled via tooltipDelay)
         source_docs = data.get("source_documents", [])
-        if source_docs:
-            tooltip_parts.append(f"Sources: {', '.join(source_docs[:3])}")
         attrs = data.get("attributes", {})
+        top_attributes = []
         aliases_raw = []
         if isinstance(attrs, dict):
-            for k, v in list(attrs.items())[:4]:
-                tooltip_parts.append(f"{k}: {v}")
+            top_attributes = [[k, str(v)] for k, v in islice(attrs.items(), 4)]
             aliases_raw = attrs.get("aliases", []) or attrs.get("also_known_as", [])
             if isinstance(aliases_raw, str):
                 aliases_raw = [aliases_raw]
         aliases_str = ", ".join(str(a) for a in aliases_raw) if aliases_raw else ""
-        tooltip = "\n".join(p for p in tooltip_parts if p)
 
         size = max(8, min(50, 6 + degree * 2.5))
 
         desc = entity_descriptions.get(node_id, "")
 
-        # Seed position by community center + jitter
-        center = community_centers.get(comm_label, (0, 0))
-        jitter = 250
-        init_x = center[0] + random.uniform(-jitter, jitter)
-        init_y = center[1] + random.uniform(-jitter, jitter)
+        init_x, init_y = positions[node_id]
 
         num_source_docs = len(source_docs) if source_docs else 0
 
-        net.add_node(
-            node_id,
-            label=name,
-            title=tooltip,
-            color=node_color,
-            size=size,
-            shape="dot",
-            borderWidth=border_w,
-            x=init_x,
-            y=init_y,
-            entity_type=entity_type,
-            community=comm_label,
-            node_degree=degree,
-            num_source_docs=num_source_docs,
-            source_docs_str=",".join(source_docs) if source_docs else "",
-            full_name=name,
-            aliases=aliases_str,
-            description=desc,
-        )
+        vis_nodes.append({
+            "id": node_id,
+            "label": name,
+            "color": node_color,
+            "font": node_font,
+            "size": size,
+            "shape": "dot",
+            "borderWidth": border_w,
+            "x": init_x,
+            "y": init_y,
+            "entity_type": entity_type,
+            "community": comm_label,
+            "node_degree": degree,
+            "num_source_docs": num_source_docs,
+            "source_docs_str": ",".join(source_docs) if source_docs else "",
+            "confidence": round(confidence, 3) if isinstance(confidence, (int, float)) else None,
+            "top_attributes": top_attributes,
+            "full_name": name,
+            "aliases": aliases_str,
+            "description": desc,
+        })
+        if preset_layout:
+            vis_nodes[-1]["physics"] = False
 
     # Add edges — colored by relation type
     rel_color_map: dict[str, str] = {}
-    seen_edges: set[tuple[str, str, str]] = set()
-
-    for source, target, _key, data in kg.graph.edges(data=True, keys=True):
-        relation_type = data.get("relation_type", "UNKNOWN")
-        edge_key = (source, target, relation_type)
-        if edge_key in seen_edges:
-            continue
-        seen_edges.add(edge_key)
+    # Edges per relation type (parallel duplicates included) for the sidebar
+    rel_counts: dict[str, int] = {}
 
+    for source, target, relation_type, data in _unique_edges(kg.graph, rel_counts):
         edge_color = _color_for_relation(relation_type, rel_color_map)
         confidence = data.get("confidence", 0)
         evidence = data.get("evidence", "")
-        support_count_raw = data.get("support_count", 1)
-        try:
-            support_count = max(1, int(support_count_raw))
-        except (TypeError, ValueError):
-            support_count = 1
+        support_count = _support_count(data)
         support_docs = data.get("support_documents", [])
         if not isinstance(support_docs, list):
             support_docs = []
 
-        # Look up source/target names
-        source_name = kg.graph.nodes[source].get("name", source)
-        target_name = kg.graph.nodes[target].get("name", target)
-
-        tooltip_parts = [
-            f"{source_name} {relation_type} {target_name}",
-        ]
-        if isinstance(confidence, (int, float)):
-            tooltip_parts.append(f"Confidence: {confidence:.0%}")
-        tooltip_parts.append(f"Support mentions: {support_count}")
-        if support_docs:
-            tooltip_parts.append(f"Support docs: {len(support_docs)}")
-        if evidence:
-            ev_display = evidence[:150] + "..." if len(evidence) > 150 else evidence
-            tooltip_parts.append(f"Evidence: {ev_display}")
-        tooltip = "\n".join(p for p in tooltip_parts if p)
+        source_name = name_by_id[source]
+        target_name = name_by_id[target]
 
         # Width driven by support_count — clear steps at low end without being too thick
         width = min(10.0, 1.5 + support_count * 2.0)
 
-        net.add_edge(
-            source,
-            target,
-            title=tooltip,
-            color=edge_color,
-            width=width,
-            relation_type=relation_type,
-            source_name=source_name,
-            target_name=target_name,
-            full_evidence=evidence or "",
-            edge_confidence=float(confidence) if isinstance(confidence, (int, float)) else 0,
-            support_count=support_count,
-            support_doc_count=len(support_docs),
-            support_docs_str=",".join(support_docs) if support_docs else "",
-        )
-
-    # Write HTML then inject UI + fix Firefox height
+        vis_edges.append({
+            "from": source,
+            "to": target,
+            "arrows": "to",
+            "color": edge_color,
+            "width": width,
+            "relation_type": relation_type,
+            "source_name": source_name,
+            "target_name": target_name,
+            "full_evidence": evidence or "",
+            "edge_confidence": round(float(confidence), 3) if isinstance(confidence, (int, float)) else 0,
+            "support_count": support_count,
+            "support_doc_count": len(support_docs),
+            "support_docs_str": ",".join(support_docs) if support_docs else "",
+        })
+
+    _set_network_data(net, vis_nodes, vis_edges)
+    _use_fast_json(net)
+
+    # Write HTML (pyvis also copies its local JS lib), then inject UI + fix
+    # Firefox height in memory and write the file back once
     output_path.parent.mkdir(parents=True, exist_ok=True)
     net.write_html(str(output_path))
-    _fix_firefox_height(output_path)
-    _inject_ui(output_path, kg, entity_types_present, entity_color_map, rel_color_map, community_color_map, community=community, source_doc=source_doc)
+    html = _fix_firefox_height(output_path.read_text())
+    html = _inject_ui(html, kg, entity_types_present, entity_color_map, rel_color_map, rel_counts, community_color_map, community=community, source_doc=source_doc, straight_edges=straight_edges)
+    output_path.write_text(html)
 
     logger.info(
         f"View generated: {kg.entity_count} entities, "
@@ -524,29 +783,135 @@ def generate_view(
     return output_path
 
 
-def _fix_firefox_height(html_path: Path) -> None:
+def _unique_edges(
+    graph: nx.MultiDiGraph,
+    rel_counts: dict[str, int],
+) -> Iterator[tuple[str, str, str, dict]]:
+    """Yield (source, target, relation_type, data) once per distinct relation.
+
+    Parallel edges between a pair share one key dict in the multigraph's
+    adjacency, so duplicates are grouped with a small per-pair dict keyed by
+    relation type instead of a graph-wide set of (source, target, type)
+    tuples. Duplicates (left by graphs built without canonicalization) are
+    merged by ``_merge_parallel`` rather than dropped. Every edge,
+    duplicates included, is tallied into ``rel_counts``.
+    """
+    for source, nbrs in graph.adj.items():
+        for target, keydict in nbrs.items():
+            by_type: dict[str, dict] = {}
+            for data in keydict.values():
+                relation_type = data.get("relation_type", "UNKNOWN")
+                rel_counts[relation_type] = rel_counts.get(relation_type, 0) + 1
+                first = by_type.get(relation_type)
+                by_type[relation_type] = data if first is None else _merge_parallel(first, data)
+            for relation_type, data in by_type.items():
+                yield source, target, relation_type, data
+
+
+def _support_count(data: dict) -> int:
+    """An edge's ``support_count``, at least 1 and tolerant of bad values."""
+    try:
+        return max(1, int(data.get("support_count", 1)))
+    except (TypeError, ValueError):
+        return 1
+
+
+def _merge_parallel(first: dict, other: dict) -> dict:
+    """Combine two edges of the same relation into a new data dict.
+
+    Support counts add up, support documents are unioned in order, and the
+    higher confidence and first non-empty evidence are kept.
+    """
+    merged = dict(first)
+    merged["support_count"] = _support_count(first) + _support_count(other)
+    docs = []
+    for data in (first, other):
+        support_docs = data.get("support_documents")
+        if isinstance(support_docs, list):
+            docs.extend(d for d in support_docs if d not in docs)
+    merged["support_documents"] = docs
+    merged["confidence"] = max(first.get("confidence") or 0, other.get("confidence") or 0)
+    merged["evidence"] = first.get("evidence") or other.get("evidence", "")
+    return merged
+
+
+def _set_network_data(net: object, nodes: list[dict], edges: list[dict]) -> None:
+    """Load prebuilt vis.js node/edge dicts into a pyvis Network.
+
+    Network.add_node checks membership in a list of node ids and add_edge
+    checks both endpoints the same way, so adding one at a time is
+    O(N^2 + E*N). Every edge here joins two nodes already in ``nodes``, so
+    those checks are redundant. The dicts carry the same keys add_node and
+    add_edge would set ("id"/"label"/"shape"/"font", "from"/"to"/"arrows").
+    """
+    net.nodes = nodes
+    net.node_ids = [n["id"] for n in nodes]
+    net.node_map = {n["id"]: n for n in nodes}
+    net.edges = edges
+
+
+def _orjson_dumps(obj: object, **kwargs: object) -> str:
+    """json.dumps stand-in for Jinja's ``tojson`` filter, backed by orjson."""
+    option = orjson.OPT_SORT_KEYS if kwargs.get("sort_keys") else 0
+    return orjson.dumps(obj, option=option).decode()
+
+
+def _use_fast_json(net: object) -> None:
+    """Serialize the embedded node/edge data compactly, with orjson when installed.
+
+    pyvis renders its data through Jinja's ``tojson`` filter, which looks up
+    the dump function and its kwargs in the template environment's policies
+    on every call and still applies its own HTML-safe escaping to the result.
+    Jinja's default kwargs sort every dict's keys, which vis.js doesn't need,
+    and the stdlib's default separators pad the output with spaces.
+    """
+    env = getattr(net, "templateEnv", None)
+    if env is None:
+        return
+    env.policies["json.dumps_kwargs"] = {"separators": (",", ":")}
+    if ORJSON_AVAILABLE:
+        env.policies["json.dumps_function"] = _orjson_dumps
+
+
+def _load_json(path: Path) -> object:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
+
+def _dump_json(obj: object) -> bytes:
+    """Compact UTF-8 JSON, via orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _fix_firefox_height(html: str) -> str:
     """Fix graph container height for Firefox.
 
     pyvis sets #mynetwork to height:100% but doesn't set explicit heights
     on html/body/parent elements. Chrome infers the height, Firefox doesn't.
     """
-    html = html_path.read_text()
     fix_css = "<style>html, body { height: 100%; margin: 0; padding: 0; overflow: hidden; } .card { height: 100%; }</style>"
-    html = html.replace("</head>", f"{fix_css}\n</head>")
-    html_path.write_text(html)
+    return html.replace("</head>", f"{fix_css}\n</head>")
 
 
 def _inject_ui(
-    html_path: Path,
+    html: str,
     kg: KnowledgeGraph,
     entity_types: set[str],
     entity_color_map: dict[str, str],
     rel_color_map: dict[str, str],
+    rel_counts: dict[str, int],
     community_color_map: dict[str, str] | None = None,
     community: str | None = None,
     source_doc: str | None = None,
-) -> None:
-    """Inject sidebar with search, entity/relation/community toggles + color pickers + detail panel."""
+    straight_edges: bool = False,
+) -> str:
+    """Inject sidebar with search, entity/relation/community toggles + color pickers + detail panel.
+
+    Returns the page HTML with the UI inserted before ``</body>``.
+    """
     from string import Template
 
     viewer_dir = Path(__file__).parent / "viewer"
@@ -557,51 +922,38 @@ def _inject_ui(
     app_js = (viewer_dir / "app.js").read_text()
 
     # Entity type controls
-    entity_items = ""
-    for et in sorted(entity_types):
-        color = entity_color_map.get(et, NODE_PALETTE[0])
-        entity_items += (
-            f'<div class="type-row">'
-            f'<input type="checkbox" checked data-etype="{et}" onchange="toggleEntityType(this)">'
-            f'<input type="color" value="{color}" data-etype-color="{et}" onchange="changeEntityColor(this)">'
-            f'<span class="type-label">{et}</span>'
-            f"</div>"
-        )
+    entity_items = "".join(
+        f'<div class="type-row">'
+        f'<input type="checkbox" checked data-etype="{et}" onchange="toggleEntityType(this)">'
+        f'<input type="color" value="{entity_color_map.get(et, NODE_PALETTE[0])}" data-etype-color="{et}" onchange="changeEntityColor(this)">'
+        f'<span class="type-label">{et}</span>'
+        f"</div>"
+        for et in sorted(entity_types)
+    )
 
-    # Community controls
+    # Community controls — generate_view builds community_color_map in display order
     community_section = ""
     if community_color_map:
-        community_items = ""
-        for label in sorted(community_color_map.keys(), key=_community_sort_key):
-            color = community_color_map[label]
-            community_items += (
-                f'<div class="type-row">'
-                f'<input type="checkbox" checked data-community="{label}" onchange="toggleCommunity(this)">'
-                f'<span style="display:inline-block;width:12px;height:12px;border-radius:50%;'
-                f'background:{color};border:1px solid #555;flex-shrink:0"></span>'
-                f'<span class="type-label">{label}</span>'
-                f"</div>"
-            )
-        community_section = f'<div class="section-header" style="border-top:none">Communities</div>{community_items}'
-
-    # Relation type controls — count edges per relation type
-    rel_counts: dict[str, int] = {}
-    for _, _, _, edata in kg.graph.edges(data=True, keys=True):
-        rt = edata.get("relation_type", "UNKNOWN")
-        rel_counts[rt] = rel_counts.get(rt, 0) + 1
-
-    relation_items = ""
-    for rt in sorted(rel_color_map.keys(), key=lambda r: rel_counts.get(r, 0), reverse=True):
-        color = rel_color_map[rt]
-        checked = "" if rt == "MENTIONED_IN" else " checked"
-        count = rel_counts.get(rt, 0)
-        relation_items += (
+        community_items = "".join(
             f'<div class="type-row">'
-            f'<input type="checkbox"{checked} data-rtype="{rt}" onchange="toggleRelationType(this)">'
-            f'<span class="type-label">{rt}</span>'
-            f'<span style="margin-left:auto;font-size:10px;color:#666;flex-shrink:0">{count}</span>'
+            f'<input type="checkbox" checked data-community="{label}" onchange="toggleCommunity(this)">'
+            f'<span style="display:inline-block;width:12px;height:12px;border-radius:50%;'
+            f'background:{color};border:1px solid #555;flex-shrink:0"></span>'
+            f'<span class="type-label">{label}</span>'
             f"</div>"
+            for label, color in community_color_map.items()
         )
+        community_section = f'<div class="section-header" style="border-top:none">Communities</div>{community_items}'
+
+    # Relation type controls — counts come from generate_view's edge pass
+    relation_items = "".join(
+        f'<div class="type-row">'
+        f'<input type="checkbox"{"" if rt == "MENTIONED_IN" else " checked"} data-rtype="{rt}" onchange="toggleRelationType(this)">'
+        f'<span class="type-label">{rt}</span>'
+        f'<span style="margin-left:auto;font-size:10px;color:#666;flex-shrink:0">{rel_counts.get(rt, 0)}</span>'
+        f"</div>"
+        for rt in sorted(rel_color_map, key=lambda r: rel_counts.get(r, 0), reverse=True)
+    )
 
     # Adaptive degree filter: small graphs default to 0 so all nodes are visible
     substantive = kg.relation_count - rel_counts.get("MENTIONED_IN", 0)
@@ -625,10 +977,10 @@ def _inject_ui(
             if doc:
                 doc_entity_counts[doc] = doc_entity_counts.get(doc, 0) + 1
 
-    source_doc_options = '<option value="">All documents</option>'
-    for doc in sorted(doc_entity_counts):
-        count = doc_entity_counts[doc]
-        source_doc_options += f'<option value="{doc}">{doc} ({count})</option>'
+    source_doc_options = '<option value="">All documents</option>' + "".join(
+        f'<option value="{doc}">{doc} ({count})</option>'
+        for doc, count in sorted(doc_entity_counts.items())
+    )
 
     # Substitute HTML template
     controls_html = controls_template.substitute(
@@ -651,7 +1003,8 @@ def _inject_ui(
         "maxSourceDocs": max_source_docs,
         "focusCommunity": community or "",
         "preFilteredSourceDoc": source_doc or "",
-    })
+        "straightEdges": straight_edges,
+    }, separators=(",", ":")).replace("</", "<\\/")  # can't close the <script> early
 
     # Assemble: CSS + controls + config script + app script
     injected = (
@@ -661,6 +1014,4 @@ def _inject_ui(
         f"<script>{app_js}</script>"
     )
 
-    html = html_path.read_text()
-    html = html.replace("</body>", f"{injected}</body>")
-    html_path.write_text(html)
+    return html.replace("</body>", f"{injected}</body>")
@@ -96,6 +96,31 @@ class TestDetectCommunities:
             assert deg_0 >= deg_1
 
 
+class TestWeightedAdjacency:
+    """Test the attribute-free projection used for Louvain."""
+
+    def test_parallel_edges_become_weight(self):
+        """Edges in both directions between a pair collapse to weight 2."""
+        from sift_kg.graph.communities import weighted_adjacency
+
+        kg = KnowledgeGraph()
+        kg.add_entity("person:a", "PERSON", "A")
+        kg.add_entity("person:b", "PERSON", "B")
+        kg.add_relation("r1", "person:a", "person:b", "KNOWS")
+        kg.add_relation("r2", "person:b", "person:a", "WORKS_WITH")
+        adjacency = weighted_adjacency(kg.graph)
+        assert adjacency["person:a"]["person:b"] == {"weight": 2}
+
+    def test_exclude_documents(self):
+        """DOCUMENT nodes and MENTIONED_IN edges are left out."""
+        from sift_kg.graph.communities import weighted_adjacency
+
+        adjacency = weighted_adjacency(_build_two_cluster_graph().graph, exclude_documents=True)
+        assert "doc:test" not in adjacency
+        assert adjacency.number_of_nodes() == 20
+        assert adjacency.number_of_edges() == 91
+
+
 class TestSaveLoadCommunities:
     """Test community persistence."""
 
@@ -1,8 +1,10 @@
-"""Tests for sift_kg.extract.llm_client — specifically parse_llm_json."""
+"""Tests for sift_kg.extract.llm_client — parse_llm_json, CreditSemaphore, LLMClient."""
+
+import asyncio
 
 import pytest
 
-from sift_kg.extract.llm_client import parse_llm_json
+from sift_kg.extract.llm_client import CreditSemaphore, LLMClient, parse_llm_json
 
 
 class TestParseLlmJson:
@@ -49,6 +51,12 @@ class TestParseLlmJson:
         result = parse_llm_json(text)
         assert result == {"key": "value"}
 
+    def test_braces_inside_string_values(self):
+        """Braces inside string values don't end the object early."""
+        text = 'Result: {"reason": "uses {x} notation", "n": 1} done'
+        result = parse_llm_json(text)
+        assert result == {"reason": "uses {x} notation", "n": 1}
+
     def test_json_with_entities_and_relations(self):
         """Parse a realistic extraction response."""
         text = '''```json
@@ -90,3 +98,73 @@ class TestParseLlmJson:
         text = '{"quote": "She said \\"hello\\"."}'
         result = parse_llm_json(text)
         assert 'hello' in result["quote"]
+
+
+class TestCreditSemaphore:
+    """Test token-budget semaphore used for TPM-limited resolve batches."""
+
+    def test_reserves_and_refunds_on_completion(self):
+        """Credits are held during the call and returned when refund_time is 0."""
+        async def run():
+            sem = CreditSemaphore(max_credits=100, refund_time=0)
+
+            async def work():
+                return sem.available
+
+            during = await sem.transact(work(), credits=40)
+            return during, sem.available
+
+        during, after = asyncio.run(run())
+        assert during == 60
+        assert after == 100
+
+    def test_oversized_request_is_clamped(self):
+        """A request larger than the budget still runs instead of deadlocking."""
+        async def run():
+            sem = CreditSemaphore(max_credits=10, refund_time=0)
+
+            async def work():
+                return "done"
+
+            return await sem.transact(work(), credits=1000)
+
+        assert asyncio.run(run()) == "done"
+
+    def test_waiters_served_in_order(self):
+        """A large waiter is not overtaken by smaller requests queued behind it."""
+        async def run():
+            sem = CreditSemaphore(max_credits=10, refund_time=0)
+            order: list[str] = []
+            await sem.acquire(8)
+
+            async def take(name: str, credits: int):
+                await sem.acquire(credits)
+                order.append(name)
+
+            big = asyncio.create_task(take("big", 10))
+            small = asyncio.create_task(take("small", 1))
+            await asyncio.sleep(0)
+            # "small" fits in the 2 free credits but must queue behind "big"
+            assert order == []
+            sem.release(8)
+            await big
+            sem.release(10)
+            await small
+            return order
+
+        assert asyncio.run(run()) == ["big", "small"]
+
+
+class TestWithModel:
+    """Test deriving a client for a second model."""
+
+    def test_shares_rate_limiter(self):
+        """The derived client draws from the same RPM budget."""
+        llm = LLMClient(model="openai/gpt-4o", rpm=30, json_mode=True, timeout=60)
+        small = llm.with_model("openai/gpt-4o-mini")
+
+        assert small.model == "openai/gpt-4o-mini"
+        assert small._limiter is llm._limiter
+        assert small.timeout == 60
+        assert small._response_format is not None
+        assert small.total_cost_usd == 0.0
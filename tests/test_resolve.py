@@ -1,7 +1,9 @@
 """Tests for sift_kg.resolve (models, io, engine)."""
 
+import asyncio
 
 from sift_kg.graph.knowledge_graph import KnowledgeGraph
+from sift_kg.resolve.cache import ResolveCache
 from sift_kg.resolve.engine import apply_merges, apply_relation_rejections
 from sift_kg.resolve.io import (
     read_proposals,
@@ -16,6 +18,12 @@ from sift_kg.resolve.models import (
     RelationReviewEntry,
     RelationReviewFile,
 )
+from sift_kg.resolve.resolver import (
+    _aresolve_type_batch,
+    _exact_match_groups,
+    _find_cross_type_duplicates,
+    _merge_into,
+)
 
 
 class TestResolveModels:
@@ -150,6 +158,222 @@ class TestResolveIO:
         assert len(loaded.relations) == 0
 
 
+def _fold(proposals: list[MergeProposal]) -> list[MergeProposal]:
+    """Fold proposals through _merge_into as the resolver does."""
+    by_canonical = {}
+    for proposal in proposals:
+        _merge_into(by_canonical, proposal)
+    return [proposal for proposal, _ in by_canonical.values()]
+
+
+class TestDeduplicateProposals:
+    """Test dedup of proposals from overlapping resolve batches."""
+
+    def test_members_unioned_with_highest_confidence(self):
+        """Same canonical across batches merges members, keeping max confidence."""
+        first = MergeProposal(
+            canonical_id="a", canonical_name="A", entity_type="PERSON",
+            members=[MergeMember(id="b", name="B", confidence=0.6)],
+            reason="first",
+        )
+        second = MergeProposal(
+            canonical_id="a", canonical_name="A.", entity_type="PERSON",
+            members=[
+                MergeMember(id="b", name="B", confidence=0.9),
+                MergeMember(id="c", name="C", confidence=0.9),
+            ],
+            reason="second",
+        )
+        deduped = _fold([first, second])
+        assert len(deduped) == 1
+        members = {m.id: m.confidence for m in deduped[0].members}
+        assert members == {"b": 0.9, "c": 0.9}
+        assert deduped[0].reason == "second"
+        assert deduped[0].canonical_name == "A."
+
+    def test_distinct_canonicals_kept(self):
+        """Proposals for different canonicals pass through unchanged."""
+        proposals = [
+            MergeProposal(
+                canonical_id=cid, canonical_name=cid, entity_type="PERSON",
+                members=[MergeMember(id=f"{cid}2", name=f"{cid}2")],
+            )
+            for cid in ("a", "b")
+        ]
+        assert _fold(proposals) == proposals
+
+    def test_tie_goes_to_earliest_batch(self):
+        """Equal-rank proposals resolve by submission order, not arrival order."""
+        early = MergeProposal(
+            canonical_id="a", canonical_name="A", entity_type="PERSON",
+            members=[MergeMember(id="b", name="B", confidence=0.8)],
+            reason="early",
+        )
+        late = MergeProposal(
+            canonical_id="a", canonical_name="A.", entity_type="PERSON",
+            members=[MergeMember(id="c", name="C", confidence=0.8)],
+            reason="late",
+        )
+        by_canonical = {}
+        _merge_into(by_canonical, late, 2)
+        _merge_into(by_canonical, early, 1)
+        merged, _ = by_canonical["a"]
+        assert merged.reason == "early"
+        assert merged.canonical_name == "A"
+        assert [m.id for m in merged.members] == ["b", "c"]
+
+
+class TestCrossTypeDuplicates:
+    """Test same-name-different-type detection."""
+
+    def test_accent_and_case_variants_match(self):
+        """Names differing only in accents/case/spacing are grouped across types."""
+        kg = KnowledgeGraph()
+        kg.add_entity("location:zurich", "LOCATION", "Zürich")
+        kg.add_entity("org:zurich", "ORGANIZATION", "ZURICH ")
+        kg.add_entity("person:alice", "PERSON", "Alice")
+        kg.add_relation("r1", "person:alice", "location:zurich", "LOCATED_IN")
+
+        proposals = _find_cross_type_duplicates(kg)
+        assert len(proposals) == 1
+        assert proposals[0].canonical_id == "location:zurich"
+        assert [m.id for m in proposals[0].members] == ["org:zurich"]
+
+    def test_same_type_not_proposed(self):
+        """Same name within one type is left to the LLM batches."""
+        kg = KnowledgeGraph()
+        kg.add_entity("person:a1", "PERSON", "Alice")
+        kg.add_entity("person:a2", "PERSON", "alice")
+        assert _find_cross_type_duplicates(kg) == []
+
+
+class TestExactMatchGroups:
+    """Test the deterministic pre-pass that skips the LLM for exact matches."""
+
+    def test_folded_names_and_aliases_grouped(self):
+        """Case/spacing variants and alias hits merge; only the canonical stays."""
+        entities = [
+            {"id": "org:a", "name": "Acme Corp", "aliases": []},
+            {"id": "org:b", "name": "ACME  corp", "aliases": []},
+            {"id": "org:c", "name": "Acme Corporation", "aliases": ["acme corp"]},
+            {"id": "org:d", "name": "Zeta", "aliases": []},
+        ]
+        proposals, remaining = _exact_match_groups(entities, "ORGANIZATION")
+        assert len(proposals) == 1
+        assert proposals[0].canonical_id == "org:c"
+        assert {m.id for m in proposals[0].members} == {"org:a", "org:b"}
+        assert [e["id"] for e in remaining] == ["org:c", "org:d"]
+
+    def test_shared_alias_alone_not_grouped(self):
+        """Two entities that only share an alias are left for the LLM."""
+        entities = [
+            {"id": "person:a", "name": "Robert Lee", "aliases": ["Bob"]},
+            {"id": "person:b", "name": "Robert King", "aliases": ["Bob"]},
+        ]
+        proposals, remaining = _exact_match_groups(entities, "PERSON")
+        assert proposals == []
+        assert remaining == entities
+
+
+class TestResolveTypeBatch:
+    """Test parsing of LLM resolve responses."""
+
+    ENTITIES = [
+        {"id": "person:alice", "name": "Alice", "aliases": [], "attributes": {}},
+        {"id": "person:alice_smith", "name": "Alice Smith", "aliases": [], "attributes": {}},
+    ]
+
+    def _resolve(self, mock_llm, response: dict):
+        async def acall_json(prompt):
+            return response
+        mock_llm.acall_json = acall_json
+        return asyncio.run(_aresolve_type_batch(self.ENTITIES, "PERSON", mock_llm))
+
+    def test_out_of_range_confidence_clamped(self, mock_llm, tmp_dir):
+        """LLM confidences outside [0, 1] are clamped and still round-trip."""
+        proposals, _ = self._resolve(mock_llm, {"groups": [{
+            "canonical_id": "person:alice_smith",
+            "member_ids": ["person:alice", "person:alice_smith"],
+            "confidence": 1.4,
+            "reason": None,
+        }]})
+        assert len(proposals) == 1
+        assert proposals[0].members[0].confidence == 1.0
+        assert proposals[0].reason == ""
+
+        path = tmp_dir / "proposals.yaml"
+        write_proposals(MergeFile(proposals=proposals), path)
+        assert read_proposals(path).proposals[0].members[0].id == "person:alice"
+
+    def test_unknown_member_ids_dropped(self, mock_llm):
+        """Groups whose members aren't in the batch produce no proposal."""
+        proposals, variants = self._resolve(mock_llm, {"groups": [{
+            "canonical_id": "person:alice",
+            "member_ids": ["person:alice", "person:ghost"],
+            "confidence": "high",
+        }]})
+        assert proposals == []
+        assert variants == []
+
+    def test_unknown_canonical_id_dropped(self, mock_llm):
+        """A hallucinated canonical id produces no proposal."""
+        proposals, _ = self._resolve(mock_llm, {"groups": [{
+            "canonical_id": "person:ghost",
+            "member_ids": ["person:alice", "person:alice_smith"],
+            "confidence": 0.9,
+        }]})
+        assert proposals == []
+
+    def test_cached_response_skips_llm(self, mock_llm, tmp_dir):
+        """A saved response is reused by a later run without an LLM call."""
+        calls = []
+
+        async def acall_json(prompt):
+            calls.append(prompt)
+            return {"groups": [{
+                "canonical_id": "person:alice_smith",
+                "member_ids": ["person:alice", "person:alice_smith"],
+                "confidence": 0.9,
+            }]}
+        mock_llm.acall_json = acall_json
+
+        path = tmp_dir / "resolve_cache.json"
+        cache = ResolveCache(path, "test-model")
+        asyncio.run(_aresolve_type_batch(self.ENTITIES, "PERSON", mock_llm, cache=cache))
+        cache.save()
+
+        reloaded = ResolveCache(path, "test-model")
+        proposals, _ = asyncio.run(
+            _aresolve_type_batch(self.ENTITIES, "PERSON", mock_llm, cache=reloaded)
+        )
+        assert len(calls) == 1
+        assert reloaded.hits == 1
+        assert proposals[0].canonical_id == "person:alice_smith"
+
+    def test_small_batch_escalates_when_small_model_fails(self, mock_llm):
+        """A failed small-model call falls back to the main model."""
+        from unittest.mock import MagicMock
+
+        small = MagicMock()
+        small.model = "small-model"
+
+        async def failing(prompt):
+            raise ValueError("bad JSON")
+        small.acall_json = failing
+
+        async def acall_json(prompt):
+            return {"groups": [{
+                "canonical_id": "person:alice_smith",
+                "member_ids": ["person:alice", "person:alice_smith"],
+            }]}
+        mock_llm.acall_json = acall_json
+
+        proposals, _ = asyncio.run(
+            _aresolve_type_batch(self.ENTITIES, "PERSON", mock_llm, small_llm=small)
+        )
+        assert len(proposals) == 1
+
+
 class TestApplyMerges:
     """Test entity merge application."""
 
@@ -1,5 +1,7 @@
 """Tests for sift view pre-filters."""
 
+import json
+
 import pytest
 
 from sift_kg.graph.knowledge_graph import KnowledgeGraph
@@ -107,3 +109,104 @@ class TestFilterGraph:
         result = filter_graph(kg, min_confidence=0.7, top_n=2)
         assert result.entity_count == 4
         assert result.relation_count >= 2
+
+
+class TestViewCommunities:
+    """Test the viewer's community cache."""
+
+    def test_cache_reused_until_graph_changes(self, tmp_path):
+        """A matching graph hash skips Louvain; a changed graph recomputes."""
+        from sift_kg.visualize import _graph_fingerprint, _view_communities
+
+        kg = _make_test_graph()
+        cache_path = tmp_path / "view_communities.json"
+        _view_communities(kg, cache_path).result()
+        assert cache_path.exists()
+
+        cache_path.write_text(json.dumps({
+            "graph_hash": _graph_fingerprint(kg.graph),
+            "communities": {"person:alice": "Community 7"},
+        }))
+        assert _view_communities(kg, cache_path).result() == {"person:alice": "Community 7"}
+
+        kg.add_entity("person:eve", "PERSON", "Eve")
+        assert _view_communities(kg, cache_path).result() != {"person:alice": "Community 7"}
+
+
+class TestPresetLayout:
+    """Test the igraph-computed layout used for large graphs."""
+
+    def test_positions_every_node(self):
+        """Each node gets finite pixel coordinates, seeded or not."""
+        pytest.importorskip("igraph")
+        from sift_kg.visualize import _preset_layout
+
+        kg = _make_test_graph()
+        seeds = {nid: (float(i * 100), 0.0) for i, nid in enumerate(kg.graph)}
+        layout = _preset_layout(kg.graph, seeds)
+
+        assert set(layout) == set(kg.graph)
+        for x, y in layout.values():
+            assert abs(x) < 1e6 and abs(y) < 1e6
+
+
+class TestCommunityOverview:
+    """Test the one-node-per-community view for oversized graphs."""
+
+    def test_collapses_communities_and_counts_links(self):
+        """Each community becomes a node; cross-community relations become one weighted edge."""
+        from sift_kg.visualize import _community_overview
+
+        kg = _make_test_graph()
+        community_map = {nid: ("Community 1" if i % 2 else "Community 2") for i, nid in enumerate(kg.graph)}
+        cross = sum(1 for u, v in kg.graph.edges() if community_map[u] != community_map[v])
+
+        overview, overview_map, descriptions = _community_overview(kg, community_map)
+
+        assert set(overview.graph) == {"community:Community 1", "community:Community 2"}
+        assert overview_map["community:Community 1"] == "Community 1"
+        assert "--community" in descriptions["community:Community 2"]
+        support = sum(d["support_count"] for _, _, d in overview.graph.edges(data=True))
+        assert support == cross
+
+
+class TestUniqueEdges:
+    """Test parallel-edge handling in the viewer's edge pass."""
+
+    def test_duplicate_relations_merge_support(self):
+        """Duplicate relations collapse to one edge carrying their combined support."""
+        from sift_kg.visualize import _unique_edges
+
+        kg = KnowledgeGraph(canonicalize_relations=False)
+        kg.add_entity("person:alice", "PERSON", "Alice")
+        kg.add_entity("org:acme", "ORGANIZATION", "Acme")
+        kg.add_relation("r1", "person:alice", "org:acme", "WORKS_FOR", confidence=0.6, source_document="doc1")
+        kg.add_relation("r2", "person:alice", "org:acme", "WORKS_FOR", confidence=0.9, source_document="doc2")
+
+        rel_counts: dict[str, int] = {}
+        edges = list(_unique_edges(kg.graph, rel_counts))
+
+        assert rel_counts == {"WORKS_FOR": 2}
+        assert len(edges) == 1
+        data = edges[0][3]
+        assert data["support_count"] == 2
+        assert data["confidence"] == 0.9
+
+
+class TestSeedPositions:
+    """Test the viewer's starting node positions."""
+
+    def test_sunflower_within_community_disc(self):
+        """Seeds are deterministic, distinct, and inside their community's disc."""
+        from sift_kg.visualize import _SEED_RADIUS, _seed_positions
+
+        kg = _make_test_graph()
+        community_map = dict.fromkeys(kg.graph, "Community 1")
+        layout = {"": ("#333", 0.0, 0.0), "Community 1": ("#fff", 1000.0, 0.0)}
+
+        positions = _seed_positions(kg.graph, community_map, layout)
+
+        assert positions == _seed_positions(kg.graph, community_map, layout)
+        assert len(set(positions.values())) == len(positions)
+        for x, y in positions.values():
+            assert ((x - 1000.0) ** 2 + y ** 2) ** 0.5 <= _SEED_RADIUS + 0.1